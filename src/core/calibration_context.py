@@ -1,10 +1,12 @@
 # src/core/calibration_context.py
+import gc
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, Optional
 import numpy as np
 from core.roi import CalibrationManager, CalibrationProfile
+from utils.image_processing import cv2_to_base64
 
-@dataclass
+@dataclass(slots=True)
 class CalibrationContext:
     """
     Holds the state for a single run of the Calibration Wizard.
@@ -19,17 +21,48 @@ class CalibrationContext:
     # Step 3 Output
     calibration_profile: Optional[CalibrationProfile] = None
 
+    # Encoded data URIs of captured_frame, keyed by grayscale flag (see captured_frame_uri)
+    _frame_uris: Dict[bool, str] = field(default_factory=dict, init=False, repr=False)
+
     def set_captured_frame(self, frame: np.ndarray):
         """
         Sets the frame and resets downstream data to ensure consistency.
         If user goes back and retakes photo, old ROIs are invalid.
         """
+        self._release_frame()
         self.captured_frame = frame
         self.calibration_manager = None
         self.calibration_profile = None
 
-    def reset(self):
-        """Clears all data."""
-        self.captured_frame = None
+    def captured_frame_uri(self, use_grayscale: bool = False) -> Optional[str]:
+        """
+        Returns captured_frame as a base64 JPEG data URI, encoding it only once
+        per frame. Steps 2 and 3 show the same image on every (re)render.
+        """
+        if self.captured_frame is None:
+            return None
+        uri = self._frame_uris.get(use_grayscale)
+        if uri is None:
+            uri = cv2_to_base64(self.captured_frame, use_grayscale=use_grayscale)
+            self._frame_uris[use_grayscale] = uri
+        return uri
+
+    def reset(self, collect: bool = False):
+        """
+        Clears all data.
+        Args:
+            collect: Also run the garbage collector, for callers that need
+                     the previous frame's memory back immediately.
+        """
+        self._release_frame()
         self.calibration_manager = None
         self.calibration_profile = None
+        if collect:
+            gc.collect()
+
+    def _release_frame(self):
+        """Drops our reference to the (multi-MB) captured frame right away."""
+        old = self.captured_frame
+        self.captured_frame = None
+        self._frame_uris.clear()
+        del old
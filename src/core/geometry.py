@@ -1,7 +1,7 @@
 # src/core/geometry.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LaneDefinition:
     """
     Represents the normalized X-axis geometric constraint for a specific film side.
@@ -10,15 +10,16 @@ class LaneDefinition:
     side: str  # 'LEFT' or 'RIGHT'
     x: int
     width: int
+    # Derived once at construction; read on every ROI-matching check
+    end_x: int = field(init=False, repr=False, compare=False)
 
-    @property
-    def end_x(self) -> int:
-        return self.x + self.width
+    def __post_init__(self):
+        object.__setattr__(self, 'end_x', self.x + self.width)
     
     def to_dict(self):
         return {"side": self.side, "x": self.x, "width": self.width}
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnchorDefinition:
     """
     Represents the Y-axis geometric constraint for a specific perforation.
@@ -28,10 +29,11 @@ class AnchorDefinition:
     lane_side: str # References LaneDefinition.side
     y: int
     height: int
+    # Derived once at construction; read on every ROI-matching check
+    end_y: int = field(init=False, repr=False, compare=False)
 
-    @property
-    def end_y(self) -> int:
-        return self.y + self.height
+    def __post_init__(self):
+        object.__setattr__(self, 'end_y', self.y + self.height)
     
     def to_dict(self):
         return {"id": self.id, "lane_side": self.lane_side, "y": self.y, "height": self.height}
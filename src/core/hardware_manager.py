@@ -2,14 +2,38 @@ import os
 import sys
 import threading
 import time
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
 
 from core.log_manager import logger
 
+# Select platform-specific backend once. The MSMF variable is set at import so
+# it is in place before OpenCV initializes any Windows capture backend.
+_IS_LINUX = sys.platform.startswith('linux')
+if _IS_LINUX:
+    # V4L2 is the standard on Linux
+    _CAP_BACKEND = cv2.CAP_V4L2
+else:
+    # Disable MSMF hardware transforms to prevent issues on Windows
+    os.environ.setdefault("OPENCV_VIDEOIO_MSMF_ENABLE_HW_TRANSFORMS", "0")
+    # DSHOW is preferred for property control on Windows
+    _CAP_BACKEND = cv2.CAP_DSHOW
+
 DEFAULT_RESOLUTION = (1920, 1080)
+COLOR_ORDERS = ('BGR', 'RGB')
+OUT_POOL_SIZE = 4  # Released copy buffers kept for reuse
+STALE_FRAME_DRAIN = 2  # Queued frames dropped before a direct (non-threaded) read if BUFFERSIZE is ignored
+
+# Linux only: MJPEG decoders tried in order for the GStreamer pipeline
+# (VA-API hardware decode first, then the software decoder)
+GST_JPEG_DECODERS = ('vaapijpegdec', 'jpegdec')
+GST_PIPELINE = (
+    "v4l2src device=/dev/video{index} ! image/jpeg,width={width},height={height},framerate={fps}/1 ! "
+    "{decoder} ! videoconvert ! video/x-raw,format={color_order} ! "
+    "appsink drop=true max-buffers=1 sync=false"
+)
 
 
 class HardwareManager:
@@ -18,23 +42,49 @@ class HardwareManager:
     interface to retrieve frames from a camera device.
     """
 
-    def __init__(self, use_threading: bool = True):
+    def __init__(self, use_threading: bool = True, color_order: str = 'BGR'):
         """
         Initialize the HardwareManager.
 
         Args:
             use_threading (bool): Whether to use a separate thread for frame capture.
                                   Defaults to True for performance.
+            color_order (str): Channel order of delivered frames, 'BGR' or 'RGB'.
+                               BGR is OpenCV's native order and costs no conversion.
         """
+        if color_order not in COLOR_ORDERS:
+            raise ValueError(f"color_order must be one of {COLOR_ORDERS}, got '{color_order}'.")
+        self._color_order = color_order
+        # True when frames arrive in BGR but RGB was requested
+        self._swap_channels = False
+
         self._cap: Optional[cv2.VideoCapture] = None
         self._camera_index: Optional[int] = None
+        # True when the driver ignored CAP_PROP_BUFFERSIZE=1 and may hand out queued, stale frames
+        self._drain_on_read = False
 
         self._use_threading = use_threading
         self._capture_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._frame_lock = threading.Lock()
-
-        self._latest_frame: Optional[np.ndarray] = None
+        # Set by the worker after each publish to wake consumers in wait_for_frame
+        self._frame_event = threading.Event()
+        # Set when the latest frame has been read, so the worker knows
+        # the next grabbed frame is worth decoding
+        self._consumed = threading.Event()
+        self._consumed.set()
+
+        # Lock-free single-producer double buffer: the worker decodes into
+        # slot (write_seq & 1) and then bumps write_seq, publishing the frame.
+        # Readers take slot ((write_seq - 1) & 1). Plain int loads/stores are
+        # atomic under the GIL and only the worker writes the counter.
+        self._buffers: List[np.ndarray] = []
+        # Only serializes the worker's choice of target slot against
+        # take_latest_frame swapping a slot out; held for a list index, never a decode
+        self._slot_lock = threading.Lock()
+        self._write_seq: int = 0  # Frame generation, never reset
+        self._first_seq: int = 0  # write_seq when the current buffers were allocated
+        # Recycled destination buffers for copy=True reads (see checkout_frame)
+        self._out_pool: List[np.ndarray] = []
         self._target_fps: float = 30.0
 
     def _configure_capture(self, cap: cv2.VideoCapture, width: int, height: int) -> None:
@@ -55,19 +105,83 @@ class HardwareManager:
         # Set FOURCC first to unlock high resolution/FPS modes
         cap.set(cv2.CAP_PROP_FOURCC, vid_fmt)
 
+        # Keep a single frame queued in the driver so reads are never stale
+        buffer_capped = cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if not buffer_capped:
+            logger.warning("Failed to reduce capture buffer size; latency may be higher.")
+
         # Set resolution second
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
 
-        cap.set(cv2.CAP_PROP_FOURCC, vid_fmt)
-
         cap.set(cv2.CAP_PROP_FPS, int(self._target_fps))
 
         actual_width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
         actual_height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
         actual_fps = cap.get(cv2.CAP_PROP_FPS)
+        actual_buffer = cap.get(cv2.CAP_PROP_BUFFERSIZE)
+        actual_fourcc = self._fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC))
+
+        # Direct reads then grab past the queue first (the threaded worker drains it anyway)
+        self._drain_on_read = not buffer_capped or actual_buffer > 1
+
+        # Drivers silently fall back to raw YUY2, which caps 4K at a few FPS
+        # and adds a CPU color conversion per frame
+        if actual_fourcc != 'MJPG':
+            logger.warning(f"Camera did not accept MJPG (using '{actual_fourcc}'); expect lower FPS at high resolutions.")
+
+        logger.info(f"Configuring Camera: {actual_width}x{actual_height} @ {actual_fps:.2f} FPS [{actual_fourcc}] (buffer: {actual_buffer:.0f})")
+
+    @staticmethod
+    def _fourcc_to_str(value: float) -> str:
+        """Decodes a CAP_PROP_FOURCC value into its four-character code."""
+        code = int(value)
+        return ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00')
+
+    def _open_gstreamer(self, index: int, width: int, height: int) -> Optional[cv2.VideoCapture]:
+        """
+        Opens the camera through a GStreamer appsink pipeline (Linux only).
+        The pipeline decodes MJPEG, converts to the requested color order and
+        keeps only the newest frame natively (drop=true max-buffers=1).
+
+        Args:
+            index (int): The index of the camera device.
+            width (int): Desired frame width.
+            height (int): Desired frame height.
+
+        Returns:
+            Optional[cv2.VideoCapture]: The opened capture, or None if OpenCV lacks
+            GStreamer support or no decoder could be negotiated.
+        """
+        for decoder in GST_JPEG_DECODERS:
+            pipeline = GST_PIPELINE.format(
+                index=index, width=width, height=height, fps=int(self._target_fps),
+                decoder=decoder, color_order=self._color_order
+            )
+            cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+            if cap.isOpened():
+                logger.info(f"HardwareManager: GStreamer pipeline ready ({decoder}).")
+                return cap
+            cap.release()
+
+        logger.debug("HardwareManager: GStreamer pipeline unavailable, using V4L2.")
+        return None
+
+    def _open_capture(self, index: int) -> cv2.VideoCapture:
+        """
+        Opens the camera with the platform backend, with software decoding.
 
-        logger.info(f"Configuring Camera: {actual_width}x{actual_height} @ {actual_fps:.2f} FPS")
+        V4L2 and DSHOW do not implement CAP_PROP_HW_ACCELERATION, so asking them
+        for it only costs a failed device open. On Linux, hardware MJPEG decode
+        goes through the GStreamer pipeline instead (see _open_gstreamer).
+
+        Args:
+            index (int): The index of the camera device.
+
+        Returns:
+            cv2.VideoCapture: The capture object (may not be opened).
+        """
+        return cv2.VideoCapture(index, _CAP_BACKEND)
 
     def start_video_stream(self, index: int, width: int = DEFAULT_RESOLUTION[0], height: int = DEFAULT_RESOLUTION[1]) -> bool:
         """
@@ -85,34 +199,41 @@ class HardwareManager:
 
         logger.debug(f"HardwareManager: Opening Camera {index}...")
 
-        # Select platform-specific backend
-        if sys.platform.startswith('linux'):
-            # V4L2 is the standard on Linux
-            cap = cv2.VideoCapture(index, cv2.CAP_V4L2)
+        cap = self._open_gstreamer(index, width, height) if _IS_LINUX else None
+
+        if cap is not None:
+            # Caps are negotiated in the pipeline, already in the requested order
+            self._swap_channels = False
+            # appsink drop=true max-buffers=1 never queues more than the newest frame
+            self._drain_on_read = False
         else:
-            # Disable MSMF hardware transforms to prevent issues on Windows
-            os.environ["OPENCV_VIDEOIO_MSMF_ENABLE_HW_TRANSFORMS"] = "0"
-            # DSHOW is preferred for property control on Windows
-            cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+            cap = self._open_capture(index)
 
-        if not cap.isOpened():
-            logger.error(f"HardwareManager: Failed to open Camera {index}")
-            return False
+            if not cap.isOpened():
+                logger.error(f"HardwareManager: Failed to open Camera {index}")
+                return False
 
-        # --- CONFIGURE CAMERA PROPERTIES ---
-        self._configure_capture(cap, width, height)
+            # --- CONFIGURE CAMERA PROPERTIES ---
+            self._configure_capture(cap, width, height)
+            self._swap_channels = self._color_order == 'RGB'
 
         self._cap = cap
         self._camera_index = index
+        self._allocate_buffers(
+            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        )
 
-        # Warmup: Read a few frames to let white balance/exposure settle
+        # Warmup: Grab a few frames to let white balance/exposure settle.
+        # grab() advances the driver without decoding the throwaway frames.
         for _ in range(5):
-            self._cap.read()
+            self._cap.grab()
 
         logger.info(f"Camera #{index} Stream Ready.")
 
         if self._use_threading:
             self._stop_event.clear()
+            self._consumed.set()
             self._capture_thread = threading.Thread(
                 target=self._capture_worker,
                 name=f"CamThread-{index}",
@@ -133,55 +254,242 @@ class HardwareManager:
             self._cap.release()
 
         self._cap = None
-        with self._frame_lock:
-            self._latest_frame = None
+        self._buffers = []
+        # Release consumers blocked in wait_for_frame
+        self._frame_event.set()
+
+    def _allocate_buffers(self, height: int, width: int) -> None:
+        """
+        Preallocates the two frame buffers used by the capture worker.
+
+        Args:
+            height (int): Frame height in pixels.
+            width (int): Frame width in pixels.
+        """
+        # Nothing in the new buffers has been published yet
+        self._first_seq = self._write_seq
+        self._buffers = [
+            np.empty((height, width, 3), np.uint8),
+            np.empty((height, width, 3), np.uint8)
+        ]
 
     def _capture_worker(self) -> None:
         """
         Background loop to fetch frames.
-        Runs as fast as hardware allows to clear the buffer.
+        Runs as fast as hardware allows to clear the buffer, but only decodes
+        a frame once the previous one has been pulled by a consumer.
         """
-        # Time.sleep is not used here because cap.read() blocks naturally
+        # Time.sleep is not used here because cap.grab() blocks naturally
         # until the next frame is ready, which is the best synchronization method.
 
         while not self._stop_event.is_set():
             if self._cap is None:
                 break
 
-            # cap.read() blocks until the frame is available
-            ret, frame = self._cap.read()
+            # cap.grab() blocks until the frame is available, but skips the MJPEG decode
+            if not self._cap.grab():
+                logger.warning("HardwareManager: Empty frame. Backing off 100ms.")
+                time.sleep(0.1)  # Pause if the camera is having issues
+                continue
 
-            if ret:
-                # Process Frame (BGR -> RGB)
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Nobody has read the last frame yet: drop this one undecoded
+            if not self._consumed.is_set():
+                continue
 
-                with self._frame_lock:
-                    self._latest_frame = frame_rgb
+            with self._slot_lock:
+                target = self._buffers[self._write_seq & 1] if self._buffers else None
+            if self._swap_channels:
+                ret, frame = self._cap.retrieve()
             else:
-                logger.warning("HardwareManager: Empty frame. Backing off 100ms.")
-                time.sleep(0.1)  # Pause if the camera is having issues
+                # Decode straight into the back buffer, no conversion needed
+                ret, frame = self._cap.retrieve(target)
+            if not ret:
+                continue
+
+            # The driver may deliver a different size than requested
+            if target is None or target.shape[:2] != frame.shape[:2]:
+                self._allocate_buffers(frame.shape[0], frame.shape[1])
+                target = self._buffers[self._write_seq & 1]
+
+            if self._swap_channels:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=target)
+            elif frame is not target:
+                np.copyto(target, frame)
+
+            # Publish: from here on readers are handed this slot. Clear first,
+            # so a read of the new frame can never be lost before the clear.
+            self._consumed.clear()
+            self._write_seq += 1
+            self._frame_event.set()
+
+    def _read_published(self, copy: bool) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Returns the latest published frame without taking any lock.
+
+        Args:
+            copy (bool): Return a private copy instead of the shared buffer.
 
-    def get_latest_frame(self) -> Optional[np.ndarray]:
+        Returns:
+            Tuple[int, Optional[np.ndarray]]: The frame's generation and the frame
+            (None if nothing was published into the current buffers).
+        """
+        out: Optional[np.ndarray] = None
+        while True:
+            seq = self._write_seq
+            buffers = self._buffers
+            if not buffers or seq <= self._first_seq:
+                return seq, None
+            frame = buffers[(seq - 1) & 1]
+            if not copy:
+                break
+            if out is None or out.shape != frame.shape:
+                out = self.checkout_frame(frame.shape)
+            np.copyto(out, frame)
+            # Seqlock check: once write_seq reaches seq + 1 the worker may be
+            # decoding into this very slot, so the copy could be torn; retry
+            if self._write_seq == seq:
+                frame = out
+                break
+
+        # Let the worker decode the next frame
+        self._consumed.set()
+        return seq, frame
+
+    def take_latest_frame(self) -> Optional[np.ndarray]:
+        """
+        Hands the latest published frame over to the caller without copying it.
+        The buffer is swapped out of the double buffer and replaced by one from
+        the pool (np.empty otherwise, whose pages are only committed once the
+        worker writes it). Meant for one-off snapshots such as a capture.
+
+        Returns:
+            Optional[np.ndarray]: The frame, owned by the caller, or None if unavailable.
+        """
+        if not self._use_threading:
+            # read() already returns a fresh array
+            return self.get_latest_frame()
+
+        with self._slot_lock:
+            seq = self._write_seq
+            buffers = self._buffers
+            if not buffers or seq <= self._first_seq:
+                return None
+            # The worker's target is slot (seq & 1); the published slot is free
+            # until it publishes again and picks a target under this lock
+            idx = (seq - 1) & 1
+            frame = buffers[idx]
+            buffers[idx] = self.checkout_frame(frame.shape)
+            # The replacement holds nothing published yet
+            self._first_seq = seq
+
+        self._consumed.set()
+        return frame
+
+    def checkout_frame(self, shape: Optional[Tuple[int, ...]] = None) -> np.ndarray:
+        """
+        Takes a frame-sized buffer from the reuse pool, allocating one only
+        when the pool has nothing of the right shape. Copies handed out by
+        get_latest_frame(copy=True) come from here.
+
+        Args:
+            shape (Optional[Tuple[int, ...]]): Buffer shape. Defaults to the current stream's frame shape.
+
+        Returns:
+            np.ndarray: An uninitialized uint8 buffer owned by the caller.
+        """
+        if shape is None:
+            buffers = self._buffers
+            shape = buffers[0].shape if buffers else (DEFAULT_RESOLUTION[1], DEFAULT_RESOLUTION[0], 3)
+        while self._out_pool:
+            try:
+                buf = self._out_pool.pop()
+            except IndexError:
+                # Emptied by another thread between the check and the pop
+                break
+            if buf.shape == shape:
+                return buf
+            # Left over from a stream with another resolution: let it go
+        return np.empty(shape, np.uint8)
+
+    def release_frame(self, frame: np.ndarray) -> None:
+        """
+        Returns a buffer obtained from checkout_frame (or a copy=True read)
+        to the pool. The caller must not use it afterwards.
+
+        Args:
+            frame (np.ndarray): The buffer to recycle.
+        """
+        if len(self._out_pool) < OUT_POOL_SIZE:
+            self._out_pool.append(frame)
+
+    def get_latest_frame(self, copy: bool = False) -> Optional[np.ndarray]:
         """
         Retrieves the most recent frame captured by the worker thread.
 
+        The returned array is one of the internal buffers and is recycled by
+        the worker two frames later. Callers must not mutate it, and must pass
+        copy=True (or use take_latest_frame for a one-off snapshot) if they
+        need to keep the frame.
+        Copies come from a buffer pool; hand them back with release_frame
+        once done to avoid a fresh allocation per copy.
+
+        Args:
+            copy (bool): Return a private copy instead of the shared buffer.
+
         Returns:
-            Optional[np.ndarray]: The latest RGB frame, or None if unavailable.
+            Optional[np.ndarray]: The latest frame in the configured color order, or None if unavailable.
         """
         if self._use_threading:
-            with self._frame_lock:
-                if self._latest_frame is None:
-                    return None
-                # Return a copy to avoid modification outside the lock
-                return self._latest_frame.copy()
+            return self._read_published(copy)[1]
         else:
             # Non-threaded alternative (reads directly from the camera)
             if self._cap is None:
                 return None
+            if self._drain_on_read:
+                # The driver kept a multi-frame queue: skip to the newest frame
+                for _ in range(STALE_FRAME_DRAIN):
+                    self._cap.grab()
             ret, frame = self._cap.read()
-            if ret:
+            if not ret:
+                return None
+            self._write_seq += 1
+            if self._swap_channels:
                 return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            return None
+            return frame
+
+    def wait_for_frame(self, last_gen: int = 0, timeout: Optional[float] = None, copy: bool = False) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Blocks until a frame newer than `last_gen` is published, so consumers
+        never process the same frame twice and do not need to poll.
+
+        Args:
+            last_gen (int): Generation of the last frame the caller processed (0 for any).
+            timeout (Optional[float]): Seconds to wait; None waits indefinitely, 0 never blocks.
+            copy (bool): Return a private copy instead of the shared buffer.
+
+        Returns:
+            Tuple[int, Optional[np.ndarray]]: The current generation and the new frame,
+            or None as frame if nothing newer arrived in time or the stream stopped.
+        """
+        if not self._use_threading:
+            frame = self.get_latest_frame(copy=copy)
+            return self._write_seq, frame
+
+        def has_new_frame() -> bool:
+            # Frames from before the current buffers were allocated do not count
+            return self._write_seq > max(last_gen, self._first_seq)
+
+        while not has_new_frame() and self._cap is not None:
+            self._frame_event.clear()
+            # Re-check after clearing so a publish in between is not missed
+            if has_new_frame():
+                break
+            if not self._frame_event.wait(timeout):
+                break
+
+        if not has_new_frame():
+            return self._write_seq, None
+        return self._read_published(copy)
 
     def get_target_fps(self) -> float:
         """
@@ -1,13 +1,31 @@
 # src/core/locale_manager.py
+import functools
 import json
 import os
-from typing import Dict, Any
+import string
+from typing import Dict, Any, List, Optional, Set, Tuple
 import importlib.resources as pkg_resources
 from core.log_manager import logger
+
+try:
+    # orjson parses large bundles several times faster than the stdlib
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 I18N_PACKAGE_REF = pkg_resources.files('i18n')
 
 DEFAULT_LOCALE = 'es'
 FALLBACK_LOCALE = 'en'
+STATIC_CACHE_SIZE = 4096  # Memoized (key -> string) lookups for calls without kwargs
+
+# Parsed translation bundles, shared by every LocaleManager. Bundles ship with
+# the package and never change at runtime, so each is read and parsed once.
+_PARSED: Dict[str, Dict[str, str]] = {}
+
+# A pre-parsed format string: (literal_text, field_name, format_spec, conversion) tuples
+CompiledFormat = List[Tuple[str, Optional[str], str, Optional[str]]]
+_CONVERSIONS = {'s': str, 'r': repr, 'a': ascii}
 
 class LocaleManager:
     """
@@ -20,6 +38,15 @@ class LocaleManager:
         self._current_locale: str = DEFAULT_LOCALE
         self._translations: Dict[str, str] = {}
         self._fallback_translations: Dict[str, str] = {}
+        # Current locale layered over the fallback, so T needs a single lookup
+        self._merged: Dict[str, str] = {}
+        # Keys whose string contains a format placeholder
+        self._has_placeholder: Set[str] = set()
+        # Pre-parsed placeholder strings; None marks ones left to str.format
+        self._compiled: Dict[str, Optional[CompiledFormat]] = {}
+
+        # Per-instance memo of plain lookups; cleared whenever the locale changes
+        self._T_static = functools.lru_cache(maxsize=STATIC_CACHE_SIZE)(self._lookup)
         
         # Load fallback first for robustness
         self._fallback_translations = self._load_translations(FALLBACK_LOCALE)
@@ -29,15 +56,20 @@ class LocaleManager:
             self.set_locale(DEFAULT_LOCALE)
         else:
             self._translations = self._fallback_translations
-
+            self._set_merged(dict(self._fallback_translations))
 
         logger.info(f"LocaleManager initialized. Current: {self._current_locale}. Fallback loaded: {FALLBACK_LOCALE}")
 
     def _load_translations(self, locale: str) -> Dict[str, str]:
         """
         Loads translations for a specific locale from a JSON file using 
-        importlib.resources for robust path handling.
+        importlib.resources for robust path handling. Results are cached in
+        _PARSED so switching back to a locale costs no I/O.
         """
+        cached = _PARSED.get(locale)
+        if cached is not None:
+            return cached
+
         if I18N_PACKAGE_REF is None:
             logger.error("importlib.resources.files not available. Please use Python 3.9+.")
             return {}
@@ -46,15 +78,15 @@ class LocaleManager:
         
         try:
             # 1. Access the resource file within the package
-            file_path = I18N_PACKAGE_REF / file_name
+            file_path = I18N_PACKAGE_REF.joinpath(file_name)
             
-            # 2. Open and read the content stream
-            with file_path.open('r', encoding='utf-8') as f:
-                data = json.load(f)
-                if not isinstance(data, dict):
-                    raise TypeError("Translation file root must be a dictionary.")
-                logger.info(f"Loaded translations for locale '{locale}'.")
-                return data
+            # 2. Read the whole file in one go and parse it
+            data = _json_loads(file_path.read_bytes())
+            if not isinstance(data, dict):
+                raise TypeError("Translation file root must be a dictionary.")
+            logger.info(f"Loaded translations for locale '{locale}'.")
+            _PARSED[locale] = data
+            return data
         except FileNotFoundError:
             logger.warning(f"Translation resource not found for locale '{locale}' ({file_name}).")
             return {}
@@ -79,9 +111,49 @@ class LocaleManager:
         if new_translations:
             self._translations = new_translations
             self._current_locale = locale
+            # Fallback first so the current locale overrides it
+            self._set_merged({**self._fallback_translations, **new_translations})
         else:
             logger.warning(f"Could not load locale '{locale}'. Sticking to '{self._current_locale}'.")
 
+    def _set_merged(self, merged: Dict[str, str]) -> None:
+        """Installs a new merged lookup and rebuilds everything derived from it."""
+        self._merged = merged
+        self._has_placeholder = {k for k, v in merged.items() if '{' in v}
+        self._compiled = {k: self._compile_format(merged[k]) for k in self._has_placeholder}
+        self._T_static.cache_clear()
+
+    @staticmethod
+    def _compile_format(template: str) -> Optional[CompiledFormat]:
+        """
+        Parses a format string once so T can interpolate it without re-parsing.
+        Only plain named fields ('{count}', '{value:.2f}', '{name!r}') are
+        compiled; anything else (indexing, attributes, nested specs, malformed
+        braces) returns None and is left to str.format.
+        """
+        try:
+            parts = list(string.Formatter().parse(template))
+        except ValueError:
+            return None
+        for _, field_name, format_spec, _ in parts:
+            if field_name is not None and (not field_name.isidentifier() or '{' in format_spec):
+                return None
+        return parts
+
+    @staticmethod
+    def _render(parts: CompiledFormat, kwargs: Dict[str, Any]) -> str:
+        """Interpolates a compiled format string; raises KeyError like str.format."""
+        out = []
+        for literal, field_name, format_spec, conversion in parts:
+            if literal:
+                out.append(literal)
+            if field_name is not None:
+                value = kwargs[field_name]
+                if conversion:
+                    value = _CONVERSIONS[conversion](value)
+                out.append(format(value, format_spec))
+        return ''.join(out)
+
     @property
     def current_locale(self) -> str:
         """Returns the currently active locale identifier."""
@@ -110,33 +182,42 @@ class LocaleManager:
             >>> T('button_ok')
             'OK'
         """
-        
-        # 1. Look up in current locale
-        translated_string = self._translations.get(key)
-        
-        # 2. Look up in fallback locale if key is missing
+        if not kwargs:
+            return self._T_static(key)
+
+        translated_string = self._lookup(key)
+
+        # Plain strings have nothing to interpolate
+        if key not in self._has_placeholder:
+            return translated_string
+
+        # Perform string formatting
+        try:
+            parts = self._compiled.get(key)
+            if parts is not None:
+                return self._render(parts, kwargs)
+            # Use .format() for anything that could not be pre-parsed
+            return translated_string.format(**kwargs)
+        except KeyError as e:
+            # Handle case where the translation string has an unexpected placeholder
+            logger.error(f"Missing format key {e} for translation key '{key}' in locale '{self._current_locale}'.")
+            return translated_string
+        except Exception as e:
+            # Catch other formatting errors (e.g., incorrect type)
+            logger.error(f"Formatting failed for key '{key}' in locale '{self._current_locale}': {e}")
+            return translated_string
+
+    def _lookup(self, key: str) -> str:
+        """
+        Resolves the raw (unformatted) string for a key from the merged
+        current/fallback view, or a visible missing-key marker.
+        """
+        translated_string = self._merged.get(key)
         if translated_string is None:
-            translated_string = self._fallback_translations.get(key)
-            if translated_string is None:
-                # 3. Last resort: Return the key itself as an indication of missing translation
-                logger.warning(f"Missing translation key '{key}' in both current and fallback locales.")
-                return f"!! {key} !!"
-
-        # 4. Perform string formatting if kwargs are provided
-        if kwargs:
-            try:
-                # Use .format() for interpolation
-                return translated_string.format(**kwargs)
-            except KeyError as e:
-                # Handle case where the translation string has an unexpected placeholder
-                logger.error(f"Missing format key {e} for translation key '{key}' in locale '{self._current_locale}'.")
-                return translated_string
-            except Exception as e:
-                # Catch other formatting errors (e.g., incorrect type)
-                logger.error(f"Formatting failed for key '{key}' in locale '{self._current_locale}': {e}")
-                return translated_string
-
-        # 5. Return the raw string if no formatting is needed
+            # Last resort: Return the key itself as an indication of missing translation
+            logger.warning(f"Missing translation key '{key}' in both current and fallback locales.")
+            return f"!! {key} !!"
+
         return translated_string
 
 # Create a globally accessible singleton instance
@@ -1,7 +1,10 @@
 # src/core/log_manager.py
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
 from typing import TYPE_CHECKING, Optional
 
 # --- Configuration Constants ---
@@ -17,18 +20,8 @@ BACKUP_COUNT = 5              # Keep 5 backup logs
 LOG_LEVEL_APP = 'INFO'        # Default level for our application code
 LOG_LEVEL_ROOT = 'WARNING'    # Level for third-party libraries (to reduce noise)
 
-# --- Custom Filter for Clean Filename ---
-class FilenameCleanerFilter(logging.Filter):
-    """
-    Strips the '.py' extension from the filename field in the LogRecord for cleaner output.
-    """
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Modifies the log record in place to clean the filename."""
-        # Use filename attribute as set by the standard logging module
-        if record.filename.endswith('.py'):
-            # Removes the last 3 characters: .py
-            record.filename = record.filename[:-3] 
-        return True # Must return True to allow the record to proceed
+# Background writer for all configured handlers (see _start_queue_listener)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
 # --- Logging Setup Function ---
 
@@ -37,8 +30,8 @@ def setup_logging() -> logging.Logger:
     Initializes and configures the application logging system.
     
     Uses dictConfig for a robust, centralized configuration of file rotation, 
-    formatting, and logging levels. The formatter is updated to include 
-    the originating filename (%(filename)s) in place of the logger name.
+    formatting, and logging levels. The formatter includes the originating
+    module (%(module)s, the filename without '.py') in place of the logger name.
     """
     
     # 1. Ensure the log directory exists
@@ -50,23 +43,14 @@ def setup_logging() -> logging.Logger:
         logging.basicConfig(level=LOG_LEVEL_APP)
         return logging.getLogger('app')
 
-    if 'FilenameCleanerFilter' not in logging.__dict__:
-        logging.FilenameCleanerFilter = FilenameCleanerFilter
-
     # 2. Configuration Dictionary
     config = {
         'version': 1,
         'disable_existing_loggers': False, 
         
-        'filters': {
-            'clean_filename_filter': {
-                '()': 'logging.FilenameCleanerFilter', 
-            }
-        },
-
         'formatters': {
             'standard': {
-                'format': '[%(asctime)s] [%(levelname)-8s] %(filename)s - %(message)s',
+                'format': '[%(asctime)s] [%(levelname)-8s] %(module)s - %(message)s',
                 'datefmt': '%Y-%m-%d %H:%M:%S'
             },
         },
@@ -80,14 +64,12 @@ def setup_logging() -> logging.Logger:
                 'maxBytes': MAX_BYTES,
                 'backupCount': BACKUP_COUNT,
                 'encoding': 'utf8',
-                'filters': ['clean_filename_filter'],
             },
             'console_handler': {
                 'level': 'DEBUG', # Display all app logs on console
                 'formatter': 'standard',
                 'class': 'logging.StreamHandler',
                 'stream': 'ext://sys.stdout',
-                'filters': ['clean_filename_filter'],
             }
         },
         
@@ -112,10 +94,40 @@ def setup_logging() -> logging.Logger:
         print(f"CRITICAL ERROR: Failed to configure logging system: {e}")
         # Fallback
         logging.basicConfig(level=LOG_LEVEL_APP)
+    else:
+        # 4. Move file/console I/O off the calling threads
+        _start_queue_listener(logging.getLogger('app'), logging.getLogger())
 
-    # 4. Return the configured application logger instance
+    # 5. Return the configured application logger instance
     return logging.getLogger('app')
 
+def _start_queue_listener(*loggers: logging.Logger) -> None:
+    """
+    Swaps the handlers of the given loggers for a single QueueHandler and
+    drains the queue into the original handlers from a listener thread.
+    Hot threads (e.g. the camera capture loop) then only enqueue records
+    instead of blocking on disk writes and log rotation.
+    """
+    global _queue_listener
+
+    handlers = []
+    for log in loggers:
+        for handler in log.handlers:
+            if handler not in handlers:
+                handlers.append(handler)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for log in loggers:
+        log.handlers = [queue_handler]
+
+    # respect_handler_level keeps the per-handler levels (file: INFO, console: DEBUG)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    # Flush pending records on interpreter exit
+    atexit.register(_queue_listener.stop)
+
 # The globally accessible application logger instance
 app_logger = setup_logging() 
 
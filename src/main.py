@@ -1,5 +1,6 @@
 # src/main.py
 from nicegui import ui, app # <-- Import 'app' explicitly
+from fastapi.responses import StreamingResponse
 from ui.pages import home, dashboard, calibration
 from core.locale_manager import T
 from core.log_manager import logger
@@ -31,6 +32,11 @@ def page_dashboard():
     logger.debug("Navigated to Scan page")
     dashboard.create_page()
 
+@app.get(dashboard.STREAM_URL)
+def stream_mjpeg():
+    # Live camera as MJPEG; the dashboard's <img> points here
+    return StreamingResponse(dashboard.mjpeg_stream(), media_type=dashboard.MJPEG_MEDIA_TYPE)
+
 @ui.page('/calibration')
 def page_calibration():
     logger.debug("Navigated to Calibration page")
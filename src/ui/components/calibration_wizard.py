@@ -47,22 +47,13 @@ class CalibrationWizardOrchestrator:
         layout_controller.set_title(step.title)
         layout_controller.set_tools(tools)
 
-        # 2. Lifecycle: Enter
-        step.on_enter()
-
-        # 3. Render UI
-        self.container.clear()
-        with self.container:
-            step.render(
-                container=self.container,
-                on_next=self._handle_next,
-                on_back=self._handle_back
-            )
+        # 2. Lifecycle: Enter + Render UI (into a cleared container)
+        step.activate(self.container, on_next=self._handle_next, on_back=self._handle_back)
 
     def _handle_next(self, *args):
         """Advances to the next step."""
         current_step = self.steps[self.current_idx]
-        current_step.on_leave()
+        current_step.deactivate(self.container)
 
         if self.current_idx < len(self.steps) - 1:
             self.current_idx += 1
@@ -73,7 +64,7 @@ class CalibrationWizardOrchestrator:
     def _handle_back(self):
         """Returns to the previous step or exits."""
         current_step = self.steps[self.current_idx]
-        current_step.on_leave()
+        current_step.deactivate(self.container)
 
         if self.current_idx > 0:
             self.current_idx -= 1
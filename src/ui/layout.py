@@ -1,13 +1,30 @@
 # src/ui/layout.py
 from nicegui import ui
-from typing import Callable
+from typing import Callable, Optional
 from core.locale_manager import T
 from ui.styles.layout import GLOBAL_LAYOUT_STYLE
 from ui.layout_controller import layout_controller
 
+# Static shell classes, shared by every page
+ROOT_CLS = 'fixed inset-0 bg-[#0a0a0a] overflow-hidden'
+HEADER_CLS = (
+    'fixed top-0 left-0 right-0 h-16 z-50 '
+    'items-center justify-between px-6 '
+    'bg-slate-900/90 backdrop-blur-md '
+    'border-b border-white/10 shadow-sm'
+)
+HEADER_TITLE_CLS = 'text-lg font-bold tracking-wider text-slate-100'
+
+_shared_head_installed = False
+
 def theme_setup() -> None:
     """Configures global theme colors and styles."""
-    ui.dark_mode().enable()
+    global _shared_head_installed
+    # Dark mode comes from ui.run(dark=True). The global stylesheet is registered once
+    # as shared head HTML, so navigations do not re-send it per page.
+    if not _shared_head_installed:
+        ui.add_head_html(GLOBAL_LAYOUT_STYLE, shared=True)
+        _shared_head_installed = True
     ui.colors(
         primary='#5898d4',    
         secondary='#262626', 
@@ -17,25 +34,23 @@ def theme_setup() -> None:
         info='#31ccec',
         warning='#f2c037'
     )
-    ui.add_head_html(GLOBAL_LAYOUT_STYLE)
 
-def main_layout(page_content_func: Callable[[], None], show_header: bool = True) -> None:
+def main_layout(page_content_func: Callable[[], None], show_header: bool = True, title: Optional[str] = None) -> None:
     """
     Global Layout Wrapper.
+    Args:
+        page_content_func: Builds the page body.
+        show_header: Whether to show the navbar.
+        title: Navbar title for this page (defaults to the layout controller's default title).
     """
     theme_setup()
     
     # --- ROOT CONTAINER ---
-    with ui.element('div').classes('fixed inset-0 bg-[#0a0a0a] overflow-hidden'):
+    with ui.element('div').classes(ROOT_CLS):
 
         # --- HEADER SECTION ---
         if show_header:
-            with ui.row().classes(
-                'fixed top-0 left-0 right-0 h-16 z-50 '
-                'items-center justify-between px-6 '
-                'bg-slate-900/90 backdrop-blur-md '
-                'border-b border-white/10 shadow-sm'
-            ):
+            with ui.row().classes(HEADER_CLS):
                 
                 # --- LEFT CLUSTER ---
                 with ui.row().classes('items-center gap-4'):
@@ -46,15 +61,16 @@ def main_layout(page_content_func: Callable[[], None], show_header: bool = True)
                     
                     ui.separator().props('vertical').classes('h-6 bg-white/10')
                     
-                    title_label = ui.label(T('app_title')).classes(
-                        'text-lg font-bold tracking-wider text-slate-100'
-                    )
+                    title_label = ui.label(T('app_title')).classes(HEADER_TITLE_CLS)
 
                 # --- RIGHT CLUSTER ---
                 tools_row = ui.row().classes('items-center gap-2')
 
                 # Register UI
                 layout_controller.register_ui(title_label, tools_row)
+                # register_ui resets to the default title; re-apply the page's own
+                if title:
+                    layout_controller.set_title(title)
 
         # --- BODY SECTION ---
         top_anchor = 'top-16' if show_header else 'top-0'
@@ -34,6 +34,9 @@ class LayoutController:
         
         self._title_label: Optional[ui.label] = None
         self._tools_container: Optional[ui.row] = None
+        # Tools currently rendered, index-aligned with their button elements
+        self._current_tools: List[ToolButton] = []
+        self._tool_btns: List[ui.button] = []
         self._default_title: str = "Audiovisual Lab"
         self._initialized = True
 
@@ -69,6 +72,8 @@ class LayoutController:
     def set_tools(self, tools: List[ToolButton]) -> None:
         """
         Dynamically populates the right-side tools area.
+        Buttons shared with the previous call (same leading entries) are kept;
+        only the ones after the first difference are re-created.
         
         Args:
             tools: A list of dictionaries matching the ToolButton TypedDict.
@@ -78,14 +83,34 @@ class LayoutController:
             return
 
         try:
-            self._tools_container.clear()
+            keep = 0
+            for old, new in zip(self._current_tools, tools):
+                if not self._same_tool(old, new):
+                    break
+                keep += 1
+
+            for btn in self._tool_btns[keep:]:
+                btn.delete()
+            del self._tool_btns[keep:]
+
             with self._tools_container:
-                for tool in tools:
-                    self._render_tool_button(tool)
+                for tool in tools[keep:]:
+                    self._tool_btns.append(self._render_tool_button(tool))
+            self._current_tools = list(tools)
         except Exception as e:
+            # Fall back to a full rebuild on the next call
+            self._current_tools = []
             logger.error(f"Failed to render tools: {e}")
 
-    def _render_tool_button(self, tool: ToolButton):
+    @staticmethod
+    def _same_tool(a: ToolButton, b: ToolButton) -> bool:
+        """Two tools render the same button if icon, tooltip, color and callback match."""
+        return (a.get('icon') == b.get('icon')
+                and a.get('tooltip') == b.get('tooltip')
+                and a.get('color') == b.get('color')
+                and a.get('callback') == b.get('callback'))
+
+    def _render_tool_button(self, tool: ToolButton) -> ui.button:
         """Helper to render a single button with error checking."""
         icon = tool.get('icon', 'help')
         cb = tool.get('callback', lambda: None)
@@ -97,12 +122,15 @@ class LayoutController:
         
         if tooltip:
             btn.tooltip(tooltip)
+        return btn
 
     def reset(self) -> None:
         """Resets the layout to its default state."""
         self.set_title(self._default_title)
         if self._tools_container:
             self._tools_container.clear()
+        self._current_tools = []
+        self._tool_btns = []
 
 # Global Singleton Instance
 layout_controller = LayoutController()
@@ -1,12 +1,15 @@
 # src/ui/pages/calibration_steps/step_1_capture.py
-import cv2
-from nicegui import ui
+import asyncio
+import time
+from typing import Optional
+from nicegui import background_tasks, ui
 from core.locale_manager import T
 from core.hardware_manager import global_hardware_manager
 from core.log_manager import logger
-from utils.image_processing import cv2_to_base64
-from utils.list_cameras import get_aval_video_sources, FALLBACK_SOURCES
+from utils.image_processing import cv2_to_base64, fit_for_preview, frame_fingerprint
+from utils.list_cameras import get_cached_video_sources, refresh_video_sources, FALLBACK_SOURCES
 from ui.pages.calibration_steps.step_base import CalibrationStep
+from ui.styles.calibration import DISABLED_BTN_CLS, FLOATING_PANEL_CARD_CLS, FLOATING_PANEL_ROW_CLS, FULLSCREEN_PREVIEW_CLS, PANEL_SEPARATOR_CLS
 
 class Step1Capture(CalibrationStep):
     
@@ -17,8 +20,12 @@ class Step1Capture(CalibrationStep):
     def __init__(self, context):
         super().__init__(context)
         self.preview_image = None
-        self.timer = None
+        self._preview_task = None  # The single self-pacing preview coroutine, if running
         self.capture_btn = None
+        self.source_select = None
+        self._sources_timer = None  # Polls for the background device probe, while one is pending
+        self._preview_gen = 0  # Generation of the last frame pushed to the preview
+        self._last_hash = None  # Fingerprint of the last frame pushed to the preview
 
     def on_enter(self):
         """Start hardware resources if possible."""
@@ -26,41 +33,108 @@ class Step1Capture(CalibrationStep):
 
     def on_leave(self):
         """Ensure camera is off when leaving step."""
-        if self.timer:
-            self.timer.deactivate()
+        self._stop_preview()
         global_hardware_manager.stop_video_stream()
+        if self._sources_timer is not None:
+            self._sources_timer.cancel()
+            self._sources_timer = None
+        # Their elements are cleared with the container
+        self.preview_image = None
+        self.capture_btn = None
+        self.source_select = None
+
+    async def _push_preview(self):
+        """Encodes and sends the newest frame, if the worker published one since the last push."""
+        # Non-blocking: only re-encode when the worker published a new frame
+        gen, frame = global_hardware_manager.wait_for_frame(self._preview_gen, timeout=0, copy=True)
+        if frame is None: return
+        if not self.preview_image:
+            global_hardware_manager.release_frame(frame)
+            return
+        self._preview_gen = gen
+        # Resize + JPEG + base64 run on a worker thread so the event loop keeps serving
+        # other UI messages meanwhile. It reads a private (pooled) copy: with other readers
+        # (e.g. a /stream.mjpg client) the capture worker may reuse the shared buffer mid-encode.
+        try:
+            src = await asyncio.to_thread(self._encode_preview, frame)
+        finally:
+            global_hardware_manager.release_frame(frame)
+        # The step may have been left (preview_image dropped) while encoding
+        if src is not None and self.preview_image and not self.preview_image.is_deleted:
+            self.preview_image.set_source(src)
+
+    def _encode_preview(self, frame) -> Optional[str]:
+        # Static scene: same picture as the last push, skip encode + send
+        frame_hash = frame_fingerprint(frame)
+        if frame_hash == self._last_hash: return None
+        self._last_hash = frame_hash
+        # Encode a viewport-sized copy; the full frame is only needed on capture
+        return cv2_to_base64(fit_for_preview(frame))
+
+    async def _preview_loop(self):
+        """
+        Submit-then-wait pacing: push a frame, then sleep only for what is left of the
+        frame budget. Unlike a fixed-interval timer, slow encodes never queue up behind
+        each other and fast ones do not outrun the camera.
+        """
+        try:
+            while global_hardware_manager.is_streaming():
+                if self.preview_image is None or self.preview_image.is_deleted: break
+                frame_budget = 1.0 / global_hardware_manager.get_target_fps()
+                t0 = time.monotonic()
+                await self._push_preview()
+                await asyncio.sleep(max(0.0, frame_budget - (time.monotonic() - t0)))
+        finally:
+            # A cancelled loop must not clear the handle of one started after it
+            if self._preview_task is asyncio.current_task():
+                self._preview_task = None
+
+    @staticmethod
+    def _source_options(sources) -> dict:
+        return {s.index: s.name for s in sources} if sources else FALLBACK_SOURCES
+
+    def _poll_sources(self):
+        """Picks up the background probe result and swaps it into the selector."""
+        sources = get_cached_video_sources()
+        if sources is None: return
+        if self._sources_timer is not None:
+            self._sources_timer.cancel()
+            self._sources_timer = None
+        if self.source_select is not None and not self.source_select.is_deleted:
+            self.source_select.set_options(self._source_options(sources))
+
+    def _start_preview(self):
+        # Keep exactly one loop (and therefore one in-flight encode) per step
+        if self._preview_task is None:
+            self._preview_task = background_tasks.create(self._preview_loop(), name='step1_preview')
+
+    def _stop_preview(self):
+        if self._preview_task is not None:
+            self._preview_task.cancel()
+            self._preview_task = None
 
     def render(self, container, on_next, on_back):
         
-        # Helper: Preview Loop
-        def update_preview():
-            if not global_hardware_manager.is_streaming: return
-            frame = global_hardware_manager.get_latest_frame()
-            if frame is not None and self.preview_image:
-                self.preview_image.set_source(cv2_to_base64(frame))
-
         # Helper: Selection
         def on_camera_selected(e):
             idx = e.value
             if idx is None: return
             if global_hardware_manager.start_video_stream(idx):
+                self._last_hash = None  # The preview may still show the placeholder
                 ui.notify(T("camera_connected"), type='positive')
                 if self.capture_btn:
                     self.capture_btn.enable()
-                    self.capture_btn.classes(remove='opacity-50 cursor-not-allowed', add='hover:scale-105')
+                    self.capture_btn.classes(remove=DISABLED_BTN_CLS, add='hover:scale-105')
                 
-                # Start Timer
-                refresh_rate = 1.0 / global_hardware_manager.get_target_fps()
-                if not self.timer:
-                    self.timer = ui.timer(refresh_rate, update_preview)
-                else:
-                    self.timer.activate()
+                # Start Preview Loop
+                self._start_preview()
             else:
                 ui.notify(T("camera_conn_error"), type='negative')
 
         # Helper: Capture
         def on_capture():
-            frame = global_hardware_manager.get_latest_frame()
+            # Take ownership of the live buffer; the worker gets a replacement
+            frame = global_hardware_manager.take_latest_frame()
             if frame is not None:
                 # SAVE TO CONTEXT
                 self.context.set_captured_frame(frame)
@@ -70,23 +144,29 @@ class Step1Capture(CalibrationStep):
                 ui.notify(T("error_no_captured_image"), type='warning')
 
         # --- UI Build ---
-        sources = get_aval_video_sources()
-        options = {s.index: s.name for s in sources} if sources else FALLBACK_SOURCES
+        # Never probe devices on the event loop: use the cache, or the fallback until
+        # the background probe lands
+        sources = get_cached_video_sources()
+        options = self._source_options(sources)
 
         with container:
             # Fullscreen Preview
-            self.preview_image = ui.image('assets/color_bars.png').classes('w-full h-full object-contain')
+            self.preview_image = ui.image('assets/color_bars.png').classes(FULLSCREEN_PREVIEW_CLS)
 
             # Floating Controls
-            with ui.row().classes('absolute bottom-10 left-1/2 -translate-x-1/2 z-20'):
-                with ui.card().classes('flex-row items-center gap-6 px-8 py-4 rounded-full bg-slate-900/90 border border-slate-700 shadow-2xl'):
+            with ui.row().classes(FLOATING_PANEL_ROW_CLS):
+                with ui.card().classes(FLOATING_PANEL_CARD_CLS):
                     
-                    ui.select(options=options, label=T("video_source"), on_change=on_camera_selected) \
+                    self.source_select = ui.select(options=options, label=T("video_source"), on_change=on_camera_selected) \
                         .classes('w-52').props('outlined dense dark behavior="menu"')
                     
-                    ui.separator().props('vertical').classes('bg-slate-600 h-10')
+                    ui.separator().props('vertical').classes(PANEL_SEPARATOR_CLS)
                     
                     self.capture_btn = ui.button(T("capture"), on_click=on_capture) \
                         .props('icon=camera_alt color=accent unelevated rounded') \
-                        .classes('px-6 py-2 font-bold opacity-50 cursor-not-allowed transition-all')
+                        .classes(f'px-6 py-2 font-bold {DISABLED_BTN_CLS} transition-all')
                     self.capture_btn.disable()
+
+            if sources is None:
+                refresh_video_sources()
+                self._sources_timer = ui.timer(0.1, self._poll_sources)
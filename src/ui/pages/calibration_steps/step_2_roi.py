@@ -1,12 +1,38 @@
 # src/ui/pages/calibration_steps/step_2_roi.py
+import json
 from nicegui import ui, events
 from core.locale_manager import T
 from core.log_manager import logger
 from core.roi import CalibrationManager
-from utils.image_processing import cv2_to_base64
-from utils.draw_utils import generate_rect_svg, get_color
+from utils.draw_utils import get_color
 from ui.pages.calibration_steps.step_base import CalibrationStep
 from ui.layout_controller import ToolButton
+from ui.styles.calibration import FLOATING_PANEL_CARD_CLS, FLOATING_PANEL_ROW_CLS, PANEL_ACTION_BTN_CLS
+
+# Ghost Rect (Hidden by default), moved by the startGhostDrawing/stopGhostDrawing JS helpers
+GHOST_RECT_SVG = (
+    f'<rect id="ghost_rect" width="0" height="0" fill="{get_color("#d6cb00", 0.2)}" '
+    f'stroke="{get_color("#d6cb00", 1.0)}" stroke-width="2" vector-effect="non-scaling-stroke" '
+    'stroke-dasharray="10,5" visibility="hidden" pointer-events="none" />'
+)
+
+# Delete glyph (hitbox + ×) defined once; every ROI references it with a single <use>
+ROI_DEFS_SVG = (
+    '<defs><symbol id="roi_del" viewBox="0 0 25 25">'
+    '<rect width="25" height="25" fill="red" opacity="0.0" />'
+    '<text x="5" y="18" fill="white" font-size="20" font-weight="bold" pointer-events="none">×</text>'
+    '</symbol></defs>'
+)
+
+# Per-ROI markup: main box plus the delete glyph, grouped so the addRoi/removeRoi
+# JS helpers can patch a single ROI. Filled with (id, x, y, width, height, glyph_x, glyph_y).
+ROI_SVG_TEMPLATE = (
+    '<g id="roi_%d">'
+    '<rect x="%d" y="%d" width="%d" height="%d" stroke="#21ba45" stroke-width="2" '
+    f'fill="{get_color("#21ba45", 0.2)}" vector-effect="non-scaling-stroke" />'
+    '<use href="#roi_del" x="%d" y="%d" width="25" height="25" />'
+    '</g>'
+)
 
 class Step2ROI(CalibrationStep):
     
@@ -32,6 +58,11 @@ class Step2ROI(CalibrationStep):
             # If we already have one (navigated back), ensure it uses the current frame
             self.context.calibration_manager.raw_captured_image = self.context.captured_frame
 
+    def on_leave(self):
+        """Drops the view ref and any half-drawn ROI; the manager keeps the ROIs for back-nav."""
+        self.interactive_view = None
+        self.drawing_state['active'] = False
+
     def get_tools(self):
         """Custom tools for the Navbar."""
         return [
@@ -46,29 +77,45 @@ class Step2ROI(CalibrationStep):
     def _clear_all_rois(self):
         if self.context.calibration_manager:
             self.context.calibration_manager.clear_all_rois()
+            # The content may equal what the browser last rendered (e.g. no ROIs at render
+            # time), in which case Vue applies nothing: drop the pushed groups explicitly
+            ui.run_javascript('window.clearRois()')
             self._update_svg()
             ui.notify(T("all_rois_cleared"), type='warning', timeout=500)
 
+    @staticmethod
+    def _roi_svg(roi) -> str:
+        # Delete Icon (Simplified geometry): 25px hitbox in the top-right corner
+        bx, by = roi.x + roi.width - 25, roi.y
+        return ROI_SVG_TEMPLATE % (roi.id, roi.x, roi.y, roi.width, roi.height, bx, by)
+
+    def _build_svg(self) -> str:
+        # Existing ROIs, each rendered from the pre-formatted template and joined once
+        rois = self.context.calibration_manager.get_all_raw_rois()
+        return ROI_DEFS_SVG + GHOST_RECT_SVG + ''.join([self._roi_svg(roi) for roi in rois])
+
     def _update_svg(self):
-        """Refreshes the SVG overlay."""
+        """Rebuilds the whole SVG overlay. Single ROI edits go through _push_roi_added/_push_roi_removed."""
         if not self.interactive_view or not self.context.calibration_manager: 
             return
+        self.interactive_view.content = self._build_svg()
 
-        # Ghost Rect (Hidden by default)
-        svg_content = f'<rect id="ghost_rect" width="0" height="0" fill="{get_color("#d6cb00",0.2)}" stroke="{get_color("#d6cb00",1.0)}" stroke-width="2" vector-effect="non-scaling-stroke" stroke-dasharray="10,5" visibility="hidden" pointer-events="none" />'
-        
-        # Existing ROIs
-        rois = self.context.calibration_manager.get_all_raw_rois()
-        for roi in rois:
-            # Main Box
-            svg_content += generate_rect_svg(roi.x, roi.y, roi.width, roi.height, fill=get_color("#21ba45", 0.2), stroke="#21ba45")
-            
-            # Delete Icon (Simplified geometry)
-            bx, by = roi.x + roi.width - 25, roi.y
-            svg_content += f'<rect x="{bx}" y="{by}" width="25" height="25" fill="red" opacity="0.0" />' # Hitbox
-            svg_content += f'<text x="{bx+5}" y="{by+18}" fill="white" font-size="20" font-weight="bold" pointer-events="none">×</text>'
+    def _sync_content(self) -> None:
+        """
+        Mirrors an incremental edit into the element's content without sending it
+        (the browser already applied it), so any later re-render shows the current set.
+        """
+        if self.interactive_view and self.context.calibration_manager:
+            self.interactive_view._props['content'] = self._build_svg()
+
+    def _push_roi_added(self, roi) -> None:
+        """Appends one ROI to the live overlay instead of resending the whole SVG."""
+        ui.run_javascript(f'window.addRoi({roi.id}, {json.dumps(self._roi_svg(roi))})')
+        self._sync_content()
 
-        self.interactive_view.content = svg_content
+    def _push_roi_removed(self, roi_id: int) -> None:
+        ui.run_javascript(f'window.removeRoi({roi_id})')
+        self._sync_content()
 
     def render(self, container, on_next, on_back):
         if self.context.captured_frame is None:
@@ -76,7 +123,7 @@ class Step2ROI(CalibrationStep):
             on_back()
             return
 
-        img_src = cv2_to_base64(self.context.captured_frame, use_grayscale=True)
+        img_src = self.context.captured_frame_uri(use_grayscale=True)
 
         def on_mouse(e: events.MouseEventArguments):
             if e.image_x is None or e.image_y is None: return
@@ -87,17 +134,18 @@ class Step2ROI(CalibrationStep):
                 
                 if self.drawing_state['active']:
                     # Finish Drawing
-                    self.context.calibration_manager.add_raw_roi(self.drawing_state['start_x'], self.drawing_state['start_y'], mx, my)
+                    roi = self.context.calibration_manager.add_raw_roi(self.drawing_state['start_x'], self.drawing_state['start_y'], mx, my)
                     self.drawing_state['active'] = False
                     ui.run_javascript('window.stopGhostDrawing()')
                     ui.notify(T("roi_added"), type='positive', timeout=500)
-                    self._update_svg()
+                    if roi:
+                        self._push_roi_added(roi)
                 else:
                     # Check for Deletion or Start Drawing
                     deleted_id = self.context.calibration_manager.remove_raw_roi_from_point(mx, my)
                     if deleted_id:
                         ui.notify(T("roi_deleted"), type='warning', timeout=500)
-                        self._update_svg()
+                        self._push_roi_removed(deleted_id)
                     else:
                         # Start Drawing
                         self.drawing_state['active'] = True
@@ -143,14 +191,14 @@ class Step2ROI(CalibrationStep):
                 self._update_svg()
 
             # Overlay Task Tools
-            with ui.row().classes('absolute bottom-10 left-1/2 -translate-x-1/2 z-20'):
-                with ui.card().classes('flex-row items-center gap-6 px-8 py-4 rounded-full bg-slate-900/90 border border-slate-700 shadow-2xl'):
+            with ui.row().classes(FLOATING_PANEL_ROW_CLS):
+                with ui.card().classes(FLOATING_PANEL_CARD_CLS):
 
                     ui.button(
                         T("clear_all_rois"), 
                         on_click=self._clear_all_rois
                     ).props('icon=delete_forever color=negative unelevated rounded') \
-                    .classes('px-6 py-2 font-bold text-lg font-bold')
+                    .classes(PANEL_ACTION_BTN_CLS)
                     
                     # Spacer
                     ui.separator().props('vertical').classes('h-6 bg-white/10')
@@ -158,6 +206,6 @@ class Step2ROI(CalibrationStep):
                     # Finish Step Button
                     ui.button(T("finish_step"), on_click=on_finish_click) \
                         .props('icon=check color=positive unelevated rounded') \
-                        .classes('px-6 py-2 font-bold text-lg font-bold')
+                        .classes(PANEL_ACTION_BTN_CLS)
                 
                 
@@ -2,10 +2,74 @@
 import numpy as np
 from nicegui import ui
 from core.locale_manager import T
-from utils.image_processing import cv2_to_base64
 from ui.pages.calibration_steps.step_base import CalibrationStep
 
+try:
+    # Optional: compiles the normalization + sampling pass of the signal plots
+    from numba import njit
+except ImportError:
+    njit = None
+
 PLOT_WIDTH = 150
+PLOT_STEP = 2  # Plot every PLOT_STEP-th row of a lane signal
+
+# Styles matching original code
+L_STRIP_STYLE = 'fill="rgba(0, 255, 255, 0.2)"'
+R_STRIP_STYLE = 'fill="rgba(255, 235, 59, 0.2)"'
+L_CENTER_STYLE = 'stroke="cyan" stroke-width="1.5"'
+R_CENTER_STYLE = 'stroke="yellow" stroke-width="1.5"'
+L_BOUND_STYLE = 'stroke="cyan" stroke-width="1" stroke-dasharray="4,2" opacity="0.7"'
+R_BOUND_STYLE = 'stroke="yellow" stroke-width="1" stroke-dasharray="4,2" opacity="0.7"'
+
+LANE_RECT_TEMPLATE = '<rect x="%d" y="0" width="%d" height="%d" %s />'
+POLYLINE_TEMPLATE = '<polyline points="%s" fill="none" stroke="%s" stroke-width="1" vector-effect="non-scaling-stroke"/>'
+L_PLOT_STROKE = 'rgba(0, 255, 255, 0.5)'
+R_PLOT_STROKE = 'rgba(255, 235, 59, 0.5)'
+
+def _build_xy_numpy(signal: np.ndarray, limit: int, x_offset: float, max_width: float, mirror: bool):
+    """Plot coordinates of the first `limit` rows: x = x_offset +/- normalized signal, y = row."""
+    # min/ptp on the native dtype; only the sampled rows are ever converted to float
+    s_min = np.float32(signal.min())
+    s_range = np.float32(np.ptp(signal))
+    ys = np.arange(0, limit, PLOT_STEP)
+
+    # One float buffer, normalized in place (no full-size temporaries)
+    xs = signal[:limit:PLOT_STEP].astype(np.float32)
+    # Avoid division by zero
+    if s_range == 0:
+        xs.fill(0)
+    else:
+        np.subtract(xs, s_min, out=xs)
+        np.multiply(xs, max_width / s_range, out=xs)
+    if mirror:
+        np.subtract(x_offset, xs, out=xs)
+    else:
+        np.add(xs, x_offset, out=xs)
+    return xs, ys
+
+def _build_xy_loop(signal, limit, x_offset, max_width, mirror):
+    # Same result as _build_xy_numpy in one min/max pass plus one pass over the sampled
+    # rows, without the full-size float temporaries
+    s_min = float(signal[0])
+    s_max = s_min
+    for i in range(1, signal.shape[0]):
+        v = float(signal[i])
+        if v < s_min: s_min = v
+        elif v > s_max: s_max = v
+    s_range = s_max - s_min
+    scale = max_width / s_range if s_range != 0 else 0.0
+    if mirror: scale = -scale
+
+    n = (limit + PLOT_STEP - 1) // PLOT_STEP
+    xs = np.empty(n, dtype=np.float32)
+    ys = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        y = i * PLOT_STEP
+        xs[i] = x_offset + (float(signal[y]) - s_min) * scale
+        ys[i] = y
+    return xs, ys
+
+_build_xy = njit(cache=True, fastmath=True)(_build_xy_loop) if njit is not None else _build_xy_numpy
 
 class Step3Profile(CalibrationStep):
     
@@ -17,25 +81,38 @@ class Step3Profile(CalibrationStep):
     def _generate_signal_polyline(signal: np.ndarray, height: int, x_offset: int, max_width: int, mirror: bool = False) -> str:
         """Utility for drawing signal graphs."""
         if signal is None or len(signal) == 0: return ""
-        s_min, s_max = np.min(signal), np.max(signal)
-        
-        # Avoid division by zero
-        if s_max - s_min == 0:
-            norm_signal = np.zeros_like(signal)
-        else:
-            norm_signal = (signal - s_min) / (s_max - s_min)
-        
-        points = []
-        step = 2
+        signal = np.asarray(signal)
         # Use existing signal length or image height, whichever is smaller to prevent index errors
-        limit = min(len(norm_signal), height)
-        
-        for y in range(0, limit, step):
-            val = norm_signal[y]
-            w = val * max_width
-            x = (x_offset - w) if mirror else (x_offset + w)
-            points.append(f"{x:.1f},{y}")
-        return " ".join(points)
+        limit = min(len(signal), height)
+        xs, ys = _build_xy(signal, limit, float(x_offset), float(max_width), mirror)
+
+        # Whole-pixel coordinates: renderers snap to device pixels anyway, and int -> str
+        # conversion is much cheaper (and shorter on the wire) than '%.1f' formatting
+        n = len(ys)
+        coords = np.empty(2 * n, dtype=np.int16)
+        np.rint(xs, out=xs)
+        coords[0::2] = xs
+        coords[1::2] = ys
+        # One %-format over the interleaved x,y pairs builds the string in a single pass,
+        # without a per-point str object and list for join()
+        return ("%d,%d " * n % tuple(coords.tolist()))[:-1]
+
+    @staticmethod
+    def _generate_anchor_lines(anchors, x1: int, x2: int, bound_style: str, center_style: str) -> str:
+        """Top bound, center and bottom bound lines for every anchor."""
+        parts = []
+        for anchor in anchors or ():
+            y_start = anchor.y
+            y_mid = anchor.y + (anchor.height / 2)
+            y_end = anchor.y + anchor.height
+
+            # Top Bound
+            parts.append(f'<line x1="{x1}" y1="{y_start}" x2="{x2}" y2="{y_start}" {bound_style} vector-effect="non-scaling-stroke" />')
+            # Center Line
+            parts.append(f'<line x1="{x1}" y1="{y_mid}" x2="{x2}" y2="{y_mid}" {center_style} vector-effect="non-scaling-stroke" />')
+            # Bottom Bound
+            parts.append(f'<line x1="{x1}" y1="{y_end}" x2="{x2}" y2="{y_end}" {bound_style} vector-effect="non-scaling-stroke" />')
+        return ''.join(parts)
 
     def render(self, container, on_next, on_back):
         profile = self.context.calibration_profile
@@ -48,7 +125,7 @@ class Step3Profile(CalibrationStep):
 
         # --- Data Prep ---
         img_h, img_w = image.shape[:2]
-        img_src = cv2_to_base64(image, use_grayscale=True)
+        img_src = self.context.captured_frame_uri(use_grayscale=True)
         
         l_lane = profile.left_lane
         r_lane = profile.right_lane
@@ -56,58 +133,26 @@ class Step3Profile(CalibrationStep):
         # --- SVG Overlay Generation ---
         svg_elements = []
 
-        # Styles matching original code
-        l_strip_style = 'fill="rgba(0, 255, 255, 0.2)"' 
-        r_strip_style = 'fill="rgba(255, 235, 59, 0.2)"'
-        
-        l_center_style = 'stroke="cyan" stroke-width="1.5"'
-        r_center_style = 'stroke="yellow" stroke-width="1.5"'
-        l_bound_style = 'stroke="cyan" stroke-width="1" stroke-dasharray="4,2" opacity="0.7"'
-        r_bound_style = 'stroke="yellow" stroke-width="1" stroke-dasharray="4,2" opacity="0.7"'
-
         # 1. Vertical Strips (Lanes)
         if l_lane:
-            svg_elements.append(f'<rect x="{l_lane.x}" y="0" width="{l_lane.width}" height="{img_h}" {l_strip_style} />')
+            svg_elements.append(LANE_RECT_TEMPLATE % (l_lane.x, l_lane.width, img_h, L_STRIP_STYLE))
         if r_lane:
-            svg_elements.append(f'<rect x="{r_lane.x}" y="0" width="{r_lane.width}" height="{img_h}" {r_strip_style} />')
+            svg_elements.append(LANE_RECT_TEMPLATE % (r_lane.x, r_lane.width, img_h, R_STRIP_STYLE))
 
         # 2. Anchor Lines (Restored)
-        if l_lane and profile.left_anchors:
-            target_x = l_lane.x + l_lane.width
-            for anchor in profile.left_anchors:
-                y_start = anchor.y
-                y_mid = anchor.y + (anchor.height / 2)
-                y_end = anchor.y + anchor.height
-                
-                # Top Bound
-                svg_elements.append(f'<line x1="0" y1="{y_start}" x2="{target_x}" y2="{y_start}" {l_bound_style} vector-effect="non-scaling-stroke" />')
-                # Center Line
-                svg_elements.append(f'<line x1="0" y1="{y_mid}" x2="{target_x}" y2="{y_mid}" {l_center_style} vector-effect="non-scaling-stroke" />')
-                # Bottom Bound
-                svg_elements.append(f'<line x1="0" y1="{y_end}" x2="{target_x}" y2="{y_end}" {l_bound_style} vector-effect="non-scaling-stroke" />')
-
-        if r_lane and profile.right_anchors:
-            target_x = r_lane.x
-            for anchor in profile.right_anchors:
-                y_start = anchor.y
-                y_mid = anchor.y + (anchor.height / 2)
-                y_end = anchor.y + anchor.height
-                
-                # Top Bound
-                svg_elements.append(f'<line x1="{img_w}" y1="{y_start}" x2="{target_x}" y2="{y_start}" {r_bound_style} vector-effect="non-scaling-stroke" />')
-                # Center Line
-                svg_elements.append(f'<line x1="{img_w}" y1="{y_mid}" x2="{target_x}" y2="{y_mid}" {r_center_style} vector-effect="non-scaling-stroke" />')
-                # Bottom Bound
-                svg_elements.append(f'<line x1="{img_w}" y1="{y_end}" x2="{target_x}" y2="{y_end}" {r_bound_style} vector-effect="non-scaling-stroke" />')
+        if l_lane:
+            svg_elements.append(self._generate_anchor_lines(profile.left_anchors, 0, l_lane.x + l_lane.width, L_BOUND_STYLE, L_CENTER_STYLE))
+        if r_lane:
+            svg_elements.append(self._generate_anchor_lines(profile.right_anchors, img_w, r_lane.x, R_BOUND_STYLE, R_CENTER_STYLE))
 
         # 3. Signal Plots
         if l_lane:
             pts = self._generate_signal_polyline(profile.left_lane_signal, img_h, x_offset=0, max_width=PLOT_WIDTH, mirror=False)
-            svg_elements.append(f'<polyline points="{pts}" fill="none" stroke="rgba(0, 255, 255, 0.5)" stroke-width="1" vector-effect="non-scaling-stroke"/>')
+            svg_elements.append(POLYLINE_TEMPLATE % (pts, L_PLOT_STROKE))
 
         if r_lane:
             pts = self._generate_signal_polyline(profile.right_lane_signal, img_h, x_offset=img_w, max_width=PLOT_WIDTH, mirror=True)
-            svg_elements.append(f'<polyline points="{pts}" fill="none" stroke="rgba(255, 235, 59, 0.5)" stroke-width="1" vector-effect="non-scaling-stroke"/>')
+            svg_elements.append(POLYLINE_TEMPLATE % (pts, R_PLOT_STROKE))
 
         svg_content = "".join(svg_elements)
 
@@ -42,5 +42,20 @@ class CalibrationStep(ABC):
         pass
 
     def on_leave(self):
-        """Lifecycle hook: Called when navigating away from the step."""
+        """
+        Lifecycle hook: Called when navigating away from the step.
+        Override to release heavy resources (camera streams, element refs, frames).
+        """
         pass
+
+    def activate(self, container: ui.element, on_next: Callable, on_back: Callable):
+        """Shows this step: only its own elements live in the container afterwards."""
+        container.clear()
+        self.on_enter()
+        with container:
+            self.render(container=container, on_next=on_next, on_back=on_back)
+
+    def deactivate(self, container: ui.element):
+        """Leaves this step and drops its elements, so the DOM never accumulates old steps."""
+        self.on_leave()
+        container.clear()
@@ -1,6 +1,82 @@
 # src/ui/pages/dashboard.py
-from nicegui import ui
+import asyncio
+from typing import AsyncIterator, Optional
+from nicegui import background_tasks, ui
+from core.hardware_manager import global_hardware_manager
 from ui.layout import main_layout
+from utils.image_processing import EncoderThread
+
+# El video llega como MJPEG por HTTP: el navegador decodifica cada JPEG nativamente en un
+# <img>, sin base64 ni mensajes por el WebSocket. main.py registra la ruta.
+STREAM_URL = '/stream.mjpg'
+MJPEG_BOUNDARY = 'frame'
+MJPEG_MEDIA_TYPE = f'multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}'
+MJPEG_PART_HEADER = f'--{MJPEG_BOUNDARY}\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n'.encode('ascii')
+STREAM_IDLE_INTERVAL = 0.5  # Espera (s) entre chequeos mientras la cámara no está transmitiendo
+
+class MjpegBroadcaster:
+    """
+    Fuente compartida de STREAM_URL: un solo EncoderThread codifica cada frame una vez
+    y todos los clientes conectados envían ese mismo JPEG. El bombeo de frames y el
+    encoder viven solo mientras haya al menos un cliente.
+    """
+    def __init__(self):
+        self._encoder: Optional[EncoderThread] = None
+        self._pump: Optional[asyncio.Task] = None
+        self._clients = 0
+
+    def _subscribe(self) -> EncoderThread:
+        self._clients += 1
+        if self._encoder is None:
+            # Las copias vuelven al pool de HardwareManager una vez codificadas (o descartadas)
+            self._encoder = EncoderThread(release=global_hardware_manager.release_frame, data_uri=False).start()
+            self._pump = background_tasks.create(self._pump_frames(self._encoder), name='mjpeg_pump')
+        return self._encoder
+
+    def _unsubscribe(self) -> None:
+        self._clients -= 1
+        if self._clients == 0 and self._encoder is not None:
+            self._pump.cancel()
+            self._pump = None
+            self._encoder.stop()
+            self._encoder = None
+
+    async def _pump_frames(self, encoder: EncoderThread) -> None:
+        """Pasa cada frame nuevo de la cámara (una copia del pool) al encoder."""
+        gen = 0
+        while True:
+            if not global_hardware_manager.is_streaming():
+                await asyncio.sleep(STREAM_IDLE_INTERVAL)
+                continue
+            new_gen, frame = await asyncio.to_thread(
+                global_hardware_manager.wait_for_frame, gen, STREAM_IDLE_INTERVAL, True)
+            if frame is not None:
+                gen = new_gen
+                encoder.submit(frame)
+
+    async def frames(self) -> AsyncIterator[bytes]:
+        """
+        Cuerpo de la respuesta multipart/x-mixed-replace de un cliente: una parte por
+        JPEG nuevo. Starlette cancela el generador cuando el cliente se desconecta.
+        """
+        encoder = self._subscribe()
+        try:
+            seq = 0  # Un cliente nuevo recibe enseguida el último JPEG, si hay
+            while True:
+                new_seq, jpeg = await asyncio.to_thread(encoder.wait_newer, seq, STREAM_IDLE_INTERVAL)
+                if new_seq == seq or jpeg is None:
+                    continue
+                seq = new_seq
+                data = memoryview(jpeg).cast('B')
+                yield b''.join((MJPEG_PART_HEADER % len(data), data, b'\r\n'))
+        finally:
+            self._unsubscribe()
+
+_mjpeg_broadcaster = MjpegBroadcaster()
+
+def mjpeg_stream() -> AsyncIterator[bytes]:
+    """Stream MJPEG para un cliente nuevo de STREAM_URL (ver MjpegBroadcaster)."""
+    return _mjpeg_broadcaster.frames()
 
 def content():
     """Contenido específico del Dashboard."""
@@ -10,9 +86,9 @@ def content():
         
         # --- COLUMNA IZQUIERDA: VIDEO ---
         with ui.card().classes('w-full h-full bg-black items-center justify-center p-0 border border-gray-700'):
-            # El componente interactivo donde se pinta el video y los sensores SVG
-            video = ui.interactive_image('https://placehold.co/800x600/black/white?text=Waiting+for+Film+Preview') \
-                .classes('w-full h-full object-contain')
+            # El componente interactivo donde se pinta el video (stream MJPEG) y encima,
+            # por content=, los sensores SVG
+            ui.interactive_image(STREAM_URL).classes('w-full h-full object-contain')
             
             with ui.row().classes('absolute top-2 left-2 bg-black/50 p-1 rounded'):
                 ui.label('Film: 16mm').classes('text-xs text-gray-300')
@@ -56,6 +132,7 @@ def content():
                     .props('icon=tune outline') \
                     .classes('w-full text-gray-400 hover:text-white')
 
+
 # Esta función es la que llamará el main.py para renderizar la página
 def create_page():
     main_layout(content, show_header=True, title="DIGITALIZACIÓN")
@@ -2,10 +2,11 @@
 from nicegui import ui
 from ui.layout import main_layout
 from core.locale_manager import T
+from ui.scripts.home import ALL_HOME_SCRIPTS
 
-def menu_button(title_key: str, icon: str, target: str, subtext_key: str = ""):
+def menu_button(title: str, icon: str, target: str, subtext: str = ""):
     """
-    Creates a Dark Glass button that glows on hover.
+    Creates a Dark Glass button that glows on hover. Takes already translated strings.
     """
     with ui.button(on_click=lambda: ui.navigate.to(target)) \
             .classes('group w-full h-auto py-5 px-6 rounded-xl '
@@ -32,11 +33,11 @@ def menu_button(title_key: str, icon: str, target: str, subtext_key: str = ""):
 
             # Text
             with ui.column().classes('gap-1 items-start flex-grow'):
-                ui.label(T(title_key)).classes(
+                ui.label(title).classes(
                     'text-lg font-bold text-gray-300 group-hover:text-white tracking-wide transition-colors text-left leading-tight'
                 )
-                if subtext_key:
-                    ui.label(T(subtext_key)).classes(
+                if subtext:
+                    ui.label(subtext).classes(
                         'text-[10px] uppercase tracking-widest text-gray-600 group-hover:text-sky-400/70 font-mono transition-colors'
                     )
 
@@ -49,19 +50,21 @@ def menu_button(title_key: str, icon: str, target: str, subtext_key: str = ""):
 
 def content():
     """Contents of the Launchpad"""
+    for script in ALL_HOME_SCRIPTS: ui.add_body_html(script)
 
     # 1. GLOBAL CONTAINER: Uses flex to manage the video and content layers
     with ui.column().classes('w-full h-full items-center justify-center bg-black relative overflow-hidden p-0 m-0'):
 
         # 2. BACKGROUND VIDEO (Layer 0)
+        # Not autoplayed: lazy_video_script plays it only while visible (nothing is fetched before)
         video = ui.video(
             src='/assets/animated_background_light.mp4', # This path now works due to main.py config
-            autoplay=True,
+            autoplay=False,
             loop=True,
             muted=True,
             controls=False
-        ).classes(
-            'absolute inset-0 w-full h-full object-cover z-0'
+        ).props('preload=none playsinline').classes(
+            'lazy-video absolute inset-0 w-full h-full object-cover z-0'
         ).style(
             # CSS Filter for "Negative" effect: Invert colors, adjust hue/brightness/contrast
             'filter: invert(1) hue-rotate(230deg);'
@@ -90,9 +93,9 @@ def content():
 
             # --- Menu ---
             with ui.column().classes('w-full gap-4'):
-                menu_button('home_calibration_title', 'build', '/calibration', 'home_calibration_subtitle')
-                menu_button('home_scan_title', 'movie_filter', '/dashboard', 'home_scan_subtitle')
-                menu_button('home_settings_title', 'tune', '/settings', 'home_settings_subtitle')
+                menu_button(T('home_calibration_title'), 'build', '/calibration', T('home_calibration_subtitle'))
+                menu_button(T('home_scan_title'), 'movie_filter', '/dashboard', T('home_scan_subtitle'))
+                menu_button(T('home_settings_title'), 'tune', '/settings', T('home_settings_subtitle'))
 
         # Footer (Layer 10, same as card)
         FOOTER_TEXT_SIZE = '16px'   
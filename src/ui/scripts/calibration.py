@@ -4,4 +4,10 @@ ghost_draw_script = f"""
 </script>
 """
 
-ALL_CALIBRATION_SCRIPTS = [ghost_draw_script]
+roi_overlay_script = f"""
+<script>
+{open('src/ui/scripts/roi_overlay_script.js').read()}
+</script>
+"""
+
+ALL_CALIBRATION_SCRIPTS = [ghost_draw_script, roi_overlay_script]
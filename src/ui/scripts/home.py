@@ -0,0 +1,7 @@
+lazy_video_script = f"""
+<script>
+{open('src/ui/scripts/lazy_video_script.js').read()}
+</script>
+"""
+
+ALL_HOME_SCRIPTS = [lazy_video_script]
@@ -0,0 +1,36 @@
+// Background videos tagged with the `lazy-video` class are mounted with preload="none"
+// and no autoplay. They only download/decode while on screen and while the tab is visible.
+(() => {
+    const onScreen = new Set();
+
+    const sync = (video) => {
+        if (onScreen.has(video) && !document.hidden) {
+            video.play().catch(() => {}); // Muted autoplay may still be refused; stay paused
+        } else if (!video.paused) {
+            video.pause();
+        }
+    };
+
+    const observer = new IntersectionObserver((entries) => {
+        for (const entry of entries) {
+            if (entry.isIntersecting) onScreen.add(entry.target);
+            else onScreen.delete(entry.target);
+            sync(entry.target);
+        }
+    });
+
+    // Vue mounts page elements after this script runs, so pick the videos up as they appear
+    const attach = () => {
+        document.querySelectorAll('video.lazy-video:not([data-lazy-video])').forEach((video) => {
+            video.dataset.lazyVideo = '1';
+            observer.observe(video);
+        });
+    };
+    new MutationObserver(attach).observe(document.body, { childList: true, subtree: true });
+    attach();
+
+    // Hidden tab: stop decoding (and compositing the CSS filter) until it is shown again
+    document.addEventListener('visibilitychange', () => {
+        document.querySelectorAll('video.lazy-video').forEach(sync);
+    });
+})();
@@ -0,0 +1,29 @@
+// Incremental edits of the Step 2 ROI overlay. Python sends one ROI at a time
+// instead of re-assigning the whole interactive_image SVG content.
+// ROI groups live next to the ghost rect, inside the element that renders `content`,
+// so a later full re-render of the content replaces them instead of duplicating them.
+
+// Function called by Python when a ROI is added. `markup` is the ROI's <g id="roi_<id>"> group.
+window.addRoi = (id, markup) => {
+    const ghost = document.getElementById('ghost_rect');
+    const layer = ghost ? ghost.parentNode : null;
+    if (!layer) {
+        console.warn("ROI overlay not found in DOM");
+        return;
+    }
+
+    const existing = document.getElementById(`roi_${id}`);
+    if (existing) existing.remove();
+    layer.insertAdjacentHTML('beforeend', markup);
+};
+
+// Function called by Python when a ROI is deleted
+window.removeRoi = (id) => {
+    const group = document.getElementById(`roi_${id}`);
+    if (group) group.remove();
+};
+
+// Function called by Python when every ROI is cleared
+window.clearRois = () => {
+    document.querySelectorAll('g[id^="roi_"]').forEach((group) => group.remove());
+};
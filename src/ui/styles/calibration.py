@@ -1,3 +1,11 @@
 # src/ui/styles/calibration.py
 
 ALL_CALIBRATION_STYLES = []
+
+# Tailwind class strings shared by the wizard steps' floating control panels
+FLOATING_PANEL_ROW_CLS = 'absolute bottom-10 left-1/2 -translate-x-1/2 z-20'
+FLOATING_PANEL_CARD_CLS = 'flex-row items-center gap-6 px-8 py-4 rounded-full bg-slate-900/90 border border-slate-700 shadow-2xl'
+PANEL_SEPARATOR_CLS = 'bg-slate-600 h-10'
+PANEL_ACTION_BTN_CLS = 'px-6 py-2 font-bold text-lg font-bold'
+DISABLED_BTN_CLS = 'opacity-50 cursor-not-allowed'
+FULLSCREEN_PREVIEW_CLS = 'w-full h-full object-contain'
@@ -1,4 +1,5 @@
 import cv2
+import numpy as np
 import threading
 import time
 import sys
@@ -8,16 +9,74 @@ import os
 if sys.platform.startswith('win'):
     os.environ["OPENCV_VIDEOIO_MSMF_ENABLE_HW_TRANSFORMS"] = "0"
 
+JPEG_SOI = b'\xff\xd8'  # Marcador de inicio de todo JPEG
+
+class _FrameSeqlock:
+    """
+    Publicación sin locks entre un solo hilo escritor y un solo lector (SPSC).
+    En CPython cada asignación de atributo es atómica bajo el GIL, así que alcanza con
+    un contador de generación: el escritor publica el índice y recién después incrementa
+    gen; el lector lee gen antes y después de reclamar el buffer y reintenta si cambió.
+    """
+    def __init__(self, slots=3):
+        self.slots = slots
+        self.gen = 0        # Cantidad de frames publicados
+        self.index = 0      # Buffer publicado (el más nuevo)
+        self.claimed = None # Buffer que tiene el lector
+
+    def publish(self, index):
+        """Escritor: el buffer `index` ya está completo."""
+        self.index = index
+        self.gen += 1
+
+    def free_index(self):
+        """Escritor: buffer donde puede escribir, ni el publicado ni el del lector."""
+        index, claimed = self.index, self.claimed
+        for i in range(self.slots):
+            if i != index and i != claimed:
+                return i
+
+    def claim(self):
+        """Lector: toma el buffer publicado; devuelve (gen, index)."""
+        while True:
+            gen = self.gen
+            index = self.index
+            self.claimed = index
+            # Sin publicaciones en el medio, el escritor vio `index` como publicado o
+            # como reclamado en cada free_index(): nunca lo eligió para escribir
+            if self.gen == gen:
+                return gen, index
+
 class WebcamThreaded:
-    def __init__(self, src=0, width=1920, height=1080):
+    def __init__(self, src=0, width=1920, height=1080, raw_jpeg=False, target_fps=30):
+        """
+        raw_jpeg: el hilo guarda los bytes MJPEG tal como llegan de la cámara, sin
+        decodificarlos (ver read_jpeg_bytes). Si el backend no entrega el stream
+        comprimido, se vuelve solo al modo decodificado.
+        target_fps: tope de frames decodificados por segundo (None = sin tope). La cámara
+        se sigue vaciando con grab() a su ritmo; solo se decodifica con retrieve() cuando
+        venció el plazo y el lector ya tomó el frame anterior.
+        """
         self.src = src
         self.width = width
         self.height = height
+        self.raw_jpeg = raw_jpeg
+        self._frame_period = 1.0 / target_fps if target_fps else 0.0
+        self._next_deadline = 0.0
+        # Lo marca el lector en read()/read_jpeg_bytes(); sin lector no se decodifica nada
+        self._consumed = threading.Event()
+        self._consumed.set()
         
         self.grabbed = False
         self.frame = None
+        self.jpeg = None  # Último frame MJPEG crudo (bytes), solo con raw_jpeg
         self.started = False
-        self.read_lock = threading.Lock()
+
+        # Triple buffer: el hilo decodifica en un buffer que no es ni el publicado
+        # ni el que tiene el lector, y después solo se mueven índices (ver _FrameSeqlock).
+        # Así read() no copia 6 MB por frame y el lector puede dibujar sobre su buffer.
+        self._frames = []
+        self._slot = _FrameSeqlock(3)
         
         # --- INICIALIZACIÓN IDÉNTICA A TU SCRIPT QUE FUNCIONA ---
         print("⚡ Inicializando cámara con configuración DSHOW...")
@@ -52,6 +111,24 @@ class WebcamThreaded:
         self.grabbed, self.frame = self.cap.read()
         if not self.grabbed:
             print("❌ Advertencia: No se pudo capturar el primer frame.")
+        else:
+            self._frames = [self.frame, np.empty_like(self.frame), np.empty_like(self.frame)]
+            self._slot.publish(0)
+
+        if self.raw_jpeg:
+            self._set_raw_mode(True)
+
+    @property
+    def frame_id(self):
+        """Contador de frames publicados."""
+        return self._slot.gen
+
+    def _set_raw_mode(self, enabled):
+        # DSHOW/MSMF entregan el buffer comprimido con CONVERT_RGB=0; V4L2 además pide FORMAT=-1.
+        # Se decide por el backend que realmente abrió la cámara, no por la plataforma
+        self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0 if enabled else 1)
+        if self.cap.isOpened() and self.cap.getBackendName() == 'V4L2':
+            self.cap.set(cv2.CAP_PROP_FORMAT, -1 if enabled else 0)
 
     def start(self):
         if self.started:
@@ -65,26 +142,101 @@ class WebcamThreaded:
     def update(self):
         """Bucle infinito que corre en paralelo"""
         while self.started:
-            grabbed, frame = self.cap.read()
+            if self.raw_jpeg:
+                self._update_raw()
+                continue
+
+            # grab() no decodifica: mantiene fluyendo el pipeline del driver
+            if not self.cap.grab():
+                self.grabbed = False
+                time.sleep(0.1) # Solo dormimos si falla la cámara para no quemar CPU
+                continue
+            if not self._retrieve_due():
+                continue
+
+            back = self._slot.free_index()
+            target = self._frames[back] if self._frames else None
+            # Forma con buffer de salida: OpenCV decodifica directo en el buffer de atrás
+            grabbed, frame = self.cap.retrieve(target)
             
-            with self.read_lock:
-                self.grabbed = grabbed
-                if grabbed:
-                    self.frame = frame
+            self.grabbed = grabbed
+            if grabbed:
+                if frame is not target:
+                    # Primer frame o el driver cambió el tamaño: adoptamos el buffer nuevo
+                    if not self._frames:
+                        self._frames = [np.empty_like(frame) for _ in range(3)]
+                    self._frames[back] = frame
+                self.frame = frame
+                self._consumed.clear()
+                self._slot.publish(back)
             
-            # NOTA: No ponemos time.sleep() aquí porque cap.read() ya espera
+            # NOTA: No ponemos time.sleep() aquí porque cap.grab() ya espera
             # al hardware (33ms aprox para 30fps). Poner sleep agrega lag.
             if not grabbed:
-                time.sleep(0.1) # Solo dormimos si falla la cámara para no quemar CPU
+                time.sleep(0.1)
+
+    def _retrieve_due(self):
+        """True si toca decodificar el frame recién tomado con grab() (ver target_fps)."""
+        if not self._consumed.is_set():
+            return False
+        now = time.monotonic()
+        if now < self._next_deadline:
+            return False
+        # Plazo fijo; si nos atrasamos, se reinicia desde ahora en vez de acumular ráfagas
+        self._next_deadline = max(self._next_deadline + self._frame_period, now)
+        return True
+
+    def _update_raw(self):
+        """Un frame en modo crudo: grab + retrieve sin decodificar el MJPEG."""
+        grabbed = self.cap.grab()
+        if grabbed and not self._retrieve_due():
+            return
+        ok, buf = self.cap.retrieve() if grabbed else (False, None)
+        if not ok:
+            self.grabbed = False
+            time.sleep(0.1)
+            return
+
+        data = buf.tobytes()
+        if not data.startswith(JPEG_SOI):
+            # El backend ignoró el pedido y ya decodificó: seguimos en modo normal
+            print("⚠️ El backend no entrega MJPEG crudo; se decodifica cada frame.")
+            self._set_raw_mode(False)
+            self.raw_jpeg = False
+            return
+
+        self.grabbed = True
+        self.jpeg = data  # Una sola asignación: el lector ve el frame viejo o el nuevo entero
+        self._consumed.clear()
+        self._slot.publish(0)
+
+    def read_jpeg_bytes(self):
+        """
+        Devuelve el último frame tal como lo comprimió la cámara (bytes JPEG), o None.
+        Sirve directo para jpeg_to_base64 / un stream MJPEG: sin decode, cvtColor ni
+        re-encode. Fuera de raw_jpeg siempre es None.
+        """
+        self._consumed.set()
+        return self.jpeg
 
     def read(self):
-        """Devuelve el frame más reciente"""
-        with self.read_lock:
-            if self.frame is None:
+        """
+        Devuelve el frame más reciente, sin copiarlo.
+        El array es del lector hasta la próxima llamada a read(): el hilo nunca escribe
+        en él mientras tanto, así que se puede dibujar encima sin "tearing".
+        """
+        if self.raw_jpeg:
+            # Solo hace falta decodificar cuando alguien quiere dibujar encima
+            jpeg = self.read_jpeg_bytes()
+            if jpeg is None:
                 return None
-            # Hacemos copy() porque estamos en hilos y no queremos "tearing"
-            # (que la imagen cambie mientras la dibujas)
-            return self.frame.copy()
+            return cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+
+        if self.frame is None:
+            return None
+        _, index = self._slot.claim()
+        self._consumed.set()
+        return self._frames[index]
 
     def stop(self):
         self.started = False
@@ -102,28 +254,28 @@ if __name__ == "__main__":
 
     print("🎥 Iniciando visualización...")
     
-    # Variables FPS
-    prev_time = time.time()
+    # Variables FPS: reloj monotónico en ns, consultado solo cada 32 frames
+    FPS_CHECK_MASK = 31
+    prev_ns = time.monotonic_ns()
     frame_count = 0
-    fps_display = 0
+    fps_text = "FPS: --"  # Se re-formatea solo cuando se recalcula el FPS
 
     while True:
         # Esto es instantáneo gracias al hilo
         frame = cam.read()
         
         if frame is not None:
-            # Tu lógica de FPS
             frame_count += 1
-            curr_time = time.time()
-            elapsed = curr_time - prev_time
-            
-            if elapsed >= 1:
-                fps_display = frame_count / elapsed
-                prev_time = curr_time
-                frame_count = 0
+            if frame_count & FPS_CHECK_MASK == 0:
+                now_ns = time.monotonic_ns()
+                elapsed_ns = now_ns - prev_ns
+                if elapsed_ns >= 1_000_000_000:
+                    fps_text = f"FPS: {frame_count * 1e9 / elapsed_ns:.2f}"
+                    prev_ns = now_ns
+                    frame_count = 0
             
             # Dibujar
-            cv2.putText(frame, f"FPS: {fps_display:.2f}", (10, 30), 
+            cv2.putText(frame, fps_text, (10, 30), 
                         cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
             
             cv2.imshow("Webcam Threaded V3", frame)
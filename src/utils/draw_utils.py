@@ -1,17 +1,59 @@
 #src/utils/svg_generator.py
+from functools import lru_cache
+from typing import Sequence
+import numpy as np
 
+_RECT_TEMPLATE = '<rect x="%s" y="%s" width="%s" height="%s" stroke="%s" stroke-width="%s" fill="%s" vector-effect="non-scaling-stroke" />'
+_LINE_TEMPLATE = '<line x1="%s" y1="%s" x2="%s" y2="%s" stroke="%s" stroke-width="%s" %s vector-effect="non-scaling-stroke" />'
+_DASHARRAY = " stroke-dasharray='10,5'"
+# Trailing (stroke, stroke_width, fill/dotted) defaults for the build_overlay tuples
+_RECT_DEFAULTS = ("white", 2, "none")
+_LINE_DEFAULTS = ("white", 2, False)
+
+# Overlay geometry rarely changes between redraws, so identical elements are served from
+# the cache. Pass ints (round cv2 floats once upstream) so equal boxes share one entry.
+@lru_cache(maxsize=1024)
 def generate_rect_svg(x: int, y: int, width: int, height: int, stroke: str = "white", stroke_width: int = 2, fill: str = "none") -> str:
     """Generates an SVG rectangle element as a string."""
-    return f'<rect x="{x}" y="{y}" width="{width}" height="{height}" stroke="{stroke}" stroke-width="{stroke_width}" fill="{fill}" vector-effect="non-scaling-stroke" />'
+    return _RECT_TEMPLATE % (x, y, width, height, stroke, stroke_width, fill)
 
+@lru_cache(maxsize=1024)
 def generate_line_svg(x1: int, y1: int, x2: int, y2: int, stroke: str = "white", stroke_width: int = 2, dotted: bool = False) -> str:
     """Generates an SVG line element as a string."""
-    dasharray = " stroke-dasharray='10,5'" if dotted else ""
-    return f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{stroke}" stroke-width="{stroke_width}" {dasharray} vector-effect="non-scaling-stroke" />'
+    return _LINE_TEMPLATE % (x1, y1, x2, y2, stroke, stroke_width, _DASHARRAY if dotted else "")
+
+def build_overlay(rects: Sequence[tuple] = (), lines: Sequence[tuple] = ()) -> str:
+    """
+    Composes many shapes into one SVG fragment (e.g. for interactive_image.content),
+    formatting each straight into a pre-sized parts list and joining once.
+
+    Args:
+        rects: (x, y, width, height[, stroke[, stroke_width[, fill]]]) tuples.
+        lines: (x1, y1, x2, y2[, stroke[, stroke_width[, dotted]]]) tuples.
+
+    Returns:
+        The concatenated markup, identical to joining generate_rect_svg/generate_line_svg.
+    """
+    parts = [''] * (len(rects) + len(lines))
+    i = 0
+    for rect in rects:
+        x, y, w, h, stroke, stroke_width, fill = (*rect, *_RECT_DEFAULTS[len(rect) - 4:])
+        parts[i] = _RECT_TEMPLATE % (x, y, w, h, stroke, stroke_width, fill)
+        i += 1
+    for line in lines:
+        x1, y1, x2, y2, stroke, stroke_width, dotted = (*line, *_LINE_DEFAULTS[len(line) - 4:])
+        parts[i] = _LINE_TEMPLATE % (x1, y1, x2, y2, stroke, stroke_width, _DASHARRAY if dotted else "")
+        i += 1
+    return ''.join(parts)
+
+# Fully static overlays (fixed guides, legends): pass tuples of tuples so the result is reused
+build_static_overlay = lru_cache(maxsize=64)(build_overlay)
 
+@lru_cache(maxsize=256)
 def get_color(color: str, transparency: float) -> str:
     """
     Converts a hex color code to an rgba() string with specified transparency.
+    Results are memoized: overlays only ever use a handful of (color, alpha) pairs.
 
     Args:
         color: The hex color string (e.g., '#21ba45').
@@ -20,15 +62,24 @@ def get_color(color: str, transparency: float) -> str:
     Returns:
         The CSS rgba() string (e.g., 'rgba(33, 186, 69, 0.2)').
     """
-    # 1. Strip the '#' if present
-    hex_color = color.lstrip('#')
+    # Strip the '#' if present and parse the 6 hex digits into R, G, B in one C call
+    r, g, b = bytes.fromhex(color.lstrip('#')[:6])
 
-    # 2. Convert the 6 hex digits into R, G, B decimal values
-    # Each slice is 2 characters (0-2 for R, 2-4 for G, 4-6 for B)
-    # The int(..., 16) function handles the hex to decimal conversion
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-
-    # 3. Format the final rgba() string
+    # Format the final rgba() string
     return f"rgba({r}, {g}, {b}, {transparency})"
+
+def get_colors(colors: Sequence[str], transparencies: Sequence[float]) -> list[str]:
+    """
+    Batch version of get_color for overlays that color many shapes at once.
+    All hex codes are parsed in a single bytes.fromhex call instead of one per color.
+
+    Args:
+        colors: Hex color strings (e.g., ['#21ba45', '#d6cb00']).
+        transparencies: One alpha value per color (list or np.ndarray).
+
+    Returns:
+        The CSS rgba() strings, in order.
+    """
+    rgb = np.frombuffer(bytes.fromhex(''.join(c.lstrip('#')[:6] for c in colors)), dtype=np.uint8).reshape(-1, 3)
+    alphas = np.asarray(transparencies).tolist()
+    return [f"rgba({r}, {g}, {b}, {a})" for (r, g, b), a in zip(rgb.tolist(), alphas)]
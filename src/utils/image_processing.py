@@ -1,17 +1,206 @@
 # src/utils/image_processing.py
+import queue
+import threading
+import zlib
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
 import cv2
-import base64
 import numpy as np
+from core.log_manager import logger
 
-def cv2_to_base64(image, quality: int = 80, use_grayscale: bool = False) -> str:
-    """Converts a BGR numpy array to a string base64 JPG"""
+try:
+    # SIMD (AVX2/NEON) base64 that builds the str directly (no bytes + decode round-trip)
+    from pybase64 import b64encode_as_string
+except ImportError:
+    from base64 import b64encode
+
+    def b64encode_as_string(data) -> str:
+        return b64encode(data).decode('ascii')
+
+try:
+    # libjpeg-turbo encodes several times faster than OpenCV's bundled encoder
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJPF_GRAY, TJSAMP_420, TJSAMP_GRAY
+    _tj = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # Module or native library missing: fall back to cv2.imencode
+    _tj = None
+
+try:
+    # xxh3 is a SIMD hash; zlib.crc32 is the always-available fallback
+    from xxhash import xxh3_64_intdigest as _hash_bytes
+except ImportError:
+    _hash_bytes = zlib.crc32
+
+PREVIEW_MAX_SIZE = (1280, 720)  # (width, height) live previews are downscaled to before encoding
+FINGERPRINT_SIZE = (32, 32)  # Thumbnail hashed by frame_fingerprint
+
+def frame_fingerprint(image) -> int:
+    """
+    Cheap content hash of a frame (of a small area-averaged thumbnail), used to
+    skip re-encoding previews whose picture has not changed.
+    """
+    thumb = cv2.resize(image, FINGERPRINT_SIZE, interpolation=cv2.INTER_AREA)
+    return _hash_bytes(thumb.tobytes())
+
+def fit_for_preview(image, max_size=PREVIEW_MAX_SIZE):
+    """Downscales a frame to fit within max_size (keeping aspect ratio). Smaller frames pass through."""
+    if image is None: return None
+    h, w = image.shape[:2]
+    scale = min(max_size[0] / w, max_size[1] / h)
+    if scale >= 1.0: return image
+    size = (max(1, int(w * scale)), max(1, int(h * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+@lru_cache(maxsize=8)
+def _jpeg_params(quality: int) -> Tuple[int, ...]:
+    """cv2.imencode flags for a quality, built once: baseline JPEG without the
+    optimized-Huffman second pass (it costs more time than the few % it saves)."""
+    return (
+        int(cv2.IMWRITE_JPEG_QUALITY), int(quality),
+        int(cv2.IMWRITE_JPEG_OPTIMIZE), 0,
+        int(cv2.IMWRITE_JPEG_PROGRESSIVE), 0,
+    )
+
+def _encode_jpeg(frame, quality: int):
+    """JPEG-encodes a BGR or single-channel frame. Returns the encoded bytes, or None on failure."""
+    if _tj is not None:
+        frame = np.ascontiguousarray(frame)
+        if frame.ndim == 2:
+            return _tj.encode(frame, quality=quality, pixel_format=TJPF_GRAY, jpeg_subsample=TJSAMP_GRAY)
+        # PyTurboJPEG defaults to 4:2:2; 4:2:0 matches cv2.imencode and halves the chroma work
+        return _tj.encode(frame, quality=quality, pixel_format=TJPF_BGR, jpeg_subsample=TJSAMP_420)
+    is_success, buffer = cv2.imencode(".jpg", frame, _jpeg_params(quality))
+    return buffer if is_success else None
+
+def cv2_to_jpeg(image, quality: int = 80, use_grayscale: bool = False):
+    """
+    Converts a BGR numpy array to JPEG. Returns a bytes-like buffer (bytes or a
+    uint8 ndarray, depending on the encoder), or None on failure.
+    """
     if image is None: return None
-    if use_grayscale:
+    if image.ndim == 2 or image.shape[2] == 1:
+        # Already single-channel (e.g. a mono capture or a gray strip): encode as-is
+        frame = image.reshape(image.shape[:2])
+    elif use_grayscale:
         frame = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     else:
-        frame = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
-    is_success, buffer = cv2.imencode(".jpg", frame, encode_param)
-    if not is_success: return None
-    b64_img = base64.b64encode(buffer).decode()
-    return f'data:image/jpeg;base64,{b64_img}'
+        # Both encoders take BGR, which is what the capture pipeline delivers
+        frame = image
+    return _encode_jpeg(frame, quality)
+
+def cv2_to_base64(image, quality: int = 80, use_grayscale: bool = False) -> str:
+    """Converts a BGR numpy array to a string base64 JPG"""
+    buffer = cv2_to_jpeg(image, quality, use_grayscale)
+    if buffer is None: return None
+    return jpeg_to_base64(buffer)
+
+def jpeg_to_base64(jpeg) -> str:
+    """Wraps already-encoded JPEG bytes (e.g. a camera's raw MJPEG frame) in a data URI, no re-encode."""
+    # Flat byte view of the (n, 1) imencode array or the bytes, read in place: no tobytes() copy
+    return 'data:image/jpeg;base64,' + b64encode_as_string(memoryview(jpeg).cast('B'))
+
+class EncoderThread:
+    """
+    Encodes frames to JPEG data URIs (or plain JPEG buffers) on a dedicated thread,
+    so the NiceGUI event loop never waits on JPEG + base64. Producers submit()
+    frames into a size-1 queue (a newer frame replaces one still waiting); the UI
+    polls latest(), or blocks in wait_newer() from a worker thread. One encoder can
+    feed any number of readers, each frame being encoded once.
+
+    Submitted frames are read asynchronously and must not be modified afterwards.
+    For pooled frames (e.g. HardwareManager.get_latest_frame(copy=True)) pass
+    `release` so each one is handed back once encoded or dropped.
+    """
+    def __init__(self, quality: int = 80, use_grayscale: bool = False, preview: bool = True,
+                 release: Optional[Callable[[np.ndarray], None]] = None, data_uri: bool = True):
+        """
+        Args:
+            quality (int): JPEG quality passed to the encoder.
+            use_grayscale (bool): Encode single-channel JPEGs.
+            preview (bool): Downscale with fit_for_preview before encoding.
+            release (Optional[Callable]): Called with every frame the encoder is done with.
+            data_uri (bool): Publish base64 data URIs; False publishes the JPEG
+                buffers themselves (e.g. for an MJPEG stream).
+        """
+        self._quality = quality
+        self._use_grayscale = use_grayscale
+        self._preview = preview
+        self._release = release
+        self._data_uri = data_uri
+
+        self._queue: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=1)
+        # Guards the latest result, written by the encoder and read by the UI;
+        # notified on every new result for wait_newer()
+        self._out_cond = threading.Condition()
+        self._latest = None  # Data URI (str) or JPEG buffer, see data_uri
+        self._latest_seq: int = 0  # Bumped per encoded frame
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "EncoderThread":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="EncoderThread", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        # Hand back whatever was still waiting
+        self._drop_pending()
+
+    def submit(self, frame: np.ndarray) -> None:
+        """Queues a frame for encoding, replacing (dropping) one that is still waiting."""
+        while True:
+            try:
+                self._queue.put_nowait(frame)
+                return
+            except queue.Full:
+                self._drop_pending()
+
+    def latest(self) -> Tuple[int, Optional[Any]]:
+        """Returns (sequence, data URI or JPEG buffer) of the most recently encoded frame."""
+        with self._out_cond:
+            return self._latest_seq, self._latest
+
+    def wait_newer(self, seq: int, timeout: Optional[float] = None) -> Tuple[int, Optional[Any]]:
+        """
+        Blocks until a result newer than `seq` is published (or the timeout expires),
+        then returns latest(). Meant for worker threads, never the event loop.
+        """
+        with self._out_cond:
+            self._out_cond.wait_for(lambda: self._latest_seq != seq, timeout)
+            return self._latest_seq, self._latest
+
+    def _drop_pending(self) -> None:
+        try:
+            stale = self._queue.get_nowait()
+        except queue.Empty:
+            return
+        if self._release is not None:
+            self._release(stale)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                frame = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                image = fit_for_preview(frame) if self._preview else frame
+                encode = cv2_to_base64 if self._data_uri else cv2_to_jpeg
+                out = encode(image, quality=self._quality, use_grayscale=self._use_grayscale)
+            except Exception as e:
+                logger.error(f"EncoderThread: Failed to encode frame: {e}")
+                out = None
+            finally:
+                if self._release is not None:
+                    self._release(frame)
+            if out is not None:
+                with self._out_cond:
+                    self._latest = out
+                    self._latest_seq += 1
+                    self._out_cond.notify_all()
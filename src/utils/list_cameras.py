@@ -1,19 +1,37 @@
 #src/utils/list_cameras.py
+import os
 import sys
+import threading
+import time
 from cv2 import CAP_DSHOW, CAP_V4L2, CAP_ANY
 from dataclasses import dataclass
+from typing import Optional
 from core.locale_manager import T
+from core.log_manager import logger
 from cv2_enumerate_cameras import enumerate_cameras
 
+try:
+    import pyudev  # Optional: device hotplug notifications on Linux
+except ImportError:
+    pyudev = None
+
 # Use DSHOW for windows
 # On Linux, the default V4L2 backend is used.
 
 # Static Fallback Options, in case no cameras are detected (WEIRD CASE)
-FALLBACK_SOURCES = {
-    0: f'{T("video_device")} 1',
-    1: f'{T("video_device")} 2',
-    2: f'{T("video_device")} 3',
-}
+_DEVICE_LABEL = T("video_device")
+FALLBACK_SOURCES = {i: f'{_DEVICE_LABEL} {i + 1}' for i in range(3)}
+
+# Probing devices opens every /dev/video* (or DirectShow filter), which takes hundreds of ms.
+# Results are reused for this long, or until a hotplug event invalidates them.
+SOURCES_CACHE_TTL = 10.0  # seconds
+
+_cache_lock = threading.Lock()
+_cached_sources = None  # Optional[list[VideoSource]]
+_cached_at = 0.0
+_cached_signature = None  # Device-node signature the cached list was probed against
+_hotplug_observer = None
+_refresh_thread = None  # Background probe started by refresh_video_sources()
 
 @dataclass
 class VideoSource:
@@ -42,14 +60,126 @@ def _get_api_preference():
     else:
         return CAP_ANY
 
-def get_aval_video_sources() -> list[VideoSource]:
+def _probe_video_sources() -> list:
+    backend_flag = _get_api_preference()
+    cams = enumerate_cameras(apiPreference=backend_flag)
+    return [VideoSource(name=cam.name, index=cam.index) for cam in cams]
+
+def _device_signature():
+    """
+    Cheap fingerprint of the attached video devices (Linux: /dev/video* nodes, which are
+    recreated on every replug). None where no such listing exists, so callers always probe.
+    """
+    if not _is_linux_platform():
+        return None
+    try:
+        signature = []
+        for entry in os.scandir('/dev'):
+            if entry.name.startswith('video'):
+                st = entry.stat()
+                signature.append((entry.name, st.st_rdev, st.st_ctime_ns))
+        return tuple(sorted(signature))
+    except OSError:
+        return None
+
+def _store_sources(sources: list, signature) -> None:
+    global _cached_sources, _cached_at, _cached_signature
+    _cached_sources = sources
+    _cached_at = time.monotonic()
+    _cached_signature = signature
+
+def _cache_is_fresh() -> bool:
+    """ Must be called with _cache_lock held. Extends the TTL when the device nodes are unchanged. """
+    global _cached_at
+    if _cached_sources is None:
+        return False
+    if time.monotonic() - _cached_at < SOURCES_CACHE_TTL:
+        return True
+    if _cached_signature is not None and _device_signature() == _cached_signature:
+        _cached_at = time.monotonic()
+        return True
+    return False
+
+def invalidate_video_sources_cache() -> None:
+    """ Forces the next get_aval_video_sources() call to probe the devices again. """
+    global _cached_sources
+    with _cache_lock:
+        _cached_sources = None
+
+def _start_hotplug_monitor() -> None:
+    """ On Linux with pyudev available, drops the cache whenever a video device is added/removed. """
+    global _hotplug_observer
+    if _hotplug_observer is not None or pyudev is None or not _is_linux_platform():
+        return
+    try:
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by(subsystem='video4linux')
+
+        def on_event(action, device):
+            if action in ('add', 'remove'):
+                invalidate_video_sources_cache()
+
+        _hotplug_observer = pyudev.MonitorObserver(monitor, on_event, name='video-hotplug')
+        _hotplug_observer.daemon = True
+        _hotplug_observer.start()
+    except Exception:
+        # Netlink may be unavailable (containers, permissions); the TTL still bounds staleness
+        _hotplug_observer = False
+
+def get_aval_video_sources(refresh: bool = False) -> list[VideoSource]:
     """
     Retrieves a list of available video sources (cameras, capture devices) on the system.
+
+    Results are cached for SOURCES_CACHE_TTL seconds (and invalidated on hotplug when
+    pyudev is available). Past the TTL, the cache is kept as long as the device nodes are
+    unchanged. Pass refresh=True to force a new probe.
+
+    This blocks while probing; UI code should prefer get_cached_video_sources() together
+    with refresh_video_sources().
     """
-    backend_flag = _get_api_preference()
-    cams = enumerate_cameras(apiPreference=backend_flag)
-    camera_info_list = [VideoSource(name=cam.name, index=cam.index) for cam in cams]
-    return camera_info_list
+    _start_hotplug_monitor()
+    if not refresh:
+        with _cache_lock:
+            if _cache_is_fresh():
+                return list(_cached_sources)
+    # Probe outside the lock: it takes hundreds of ms, and get_cached_video_sources()
+    # runs on the event loop and must never wait for it
+    signature = _device_signature()
+    camera_info_list = _probe_video_sources()
+    with _cache_lock:
+        _store_sources(camera_info_list, signature)
+    return list(camera_info_list)
+
+def get_cached_video_sources() -> Optional[list[VideoSource]]:
+    """
+    Returns the last probed list without blocking, or None if it is missing or stale
+    (in which case refresh_video_sources() should be started).
+    """
+    _start_hotplug_monitor()
+    with _cache_lock:
+        return list(_cached_sources) if _cache_is_fresh() else None
+
+def _refresh_worker() -> None:
+    try:
+        get_aval_video_sources(refresh=True)
+    except Exception as e:
+        # Cache an empty list so pollers stop waiting and fall back to FALLBACK_SOURCES
+        logger.error(f"Video source enumeration failed: {e}")
+        with _cache_lock:
+            _store_sources([], None)
+
+def refresh_video_sources() -> None:
+    """
+    Probes the devices on a background thread, storing the result in the cache. Calls made
+    while a probe is already running are coalesced into it. Poll
+    get_cached_video_sources() (e.g. from a ui.timer) to pick up the result.
+    """
+    global _refresh_thread
+    with _cache_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return
+        _refresh_thread = threading.Thread(target=_refresh_worker, name='video-sources-refresh', daemon=True)
+        _refresh_thread.start()
 
 if __name__ == "__main__":
     cameras = get_aval_video_sources()